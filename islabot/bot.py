@@ -431,6 +431,7 @@ class IslaBot(commands.Bot):
             print("✓ Database connected")
             await self.db.migrate()
             print("✓ Database migrations completed")
+            await self.db.load_optouts()
         except Exception as e:
             print(f"✗ Database error during setup: {e}")
             traceback.print_exc()
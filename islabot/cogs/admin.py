@@ -11,7 +11,7 @@ from core.configurations import FEATURES
 from core.utility import now_ts, day_key, fmt
 from utils.helpers import isla_embed
 from utils.embed_utils import create_embed
-from utils.guild_config import cfg_set, cfg_get
+from utils.guild_config import cfg_set, cfg_set_many, cfg_get
 from utils.uk_parse import parse_duration_to_seconds
 from utils.economy import add_coins, get_wallet, ensure_wallet
 from utils.uk_time import uk_day_ymd
@@ -19,130 +19,147 @@ from utils.uk_time import uk_day_ymd
 ISLA_ICON = "https://i.imgur.com/5nsuuCV.png"
 STYLE1_NEUTRAL = "https://i.imgur.com/9oUjOQQ.png"
 
+# Constant replies, built once and reused
+_SERVER_ONLY_EMBED = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
+_ADMIN_ONLY_EMBED = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
+_MODS_ONLY_EMBED = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
+_NOT_FOR_YOU_EMBED = create_embed("Not for you.\n᲼᲼", title="Config", color="error", is_dm=False, is_system=False)
+_UNKNOWN_FEATURE_EMBED = create_embed("Unknown feature. Use /feature_list.", color="info", is_dm=False, is_system=False)
+
 # ============================================================================
 # CONFIG MODALS (from config_group.py)
 # ============================================================================
 
+# administrator | manage_guild, as one permission bit mask
+_ADMIN_MASK = discord.Permissions(administrator=True, manage_guild=True).value
+
 def is_admin(m: discord.Member) -> bool:
-    return m.guild_permissions.administrator or m.guild_permissions.manage_guild
+    return bool(m.guild_permissions.value & _ADMIN_MASK)
+
+class _SaveMixin:
+    """Shared on_submit for config modals: writes every (config key, field) pair in _MAPPING."""
+    _MAPPING: tuple[tuple[str, str], ...] = ()
+    _TITLE = "Config"
+
+    async def _save(self, interaction: discord.Interaction):
+        gid = interaction.guild_id
+        if not gid:
+            return await interaction.response.send_message(embed=_SERVER_ONLY_EMBED, ephemeral=True)
+        await cfg_set_many(self.bot.db, gid, {key: getattr(self, attr).value.strip() for key, attr in self._MAPPING})
+        embed = create_embed("Saved.\n᲼᲼", title=self._TITLE, color="success", is_dm=False, is_system=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-class RolesModal(discord.ui.Modal, title="Config: Roles"):
+class RolesModal(_SaveMixin, discord.ui.Modal, title="Config: Roles"):
     verified = discord.ui.TextInput(label="Verified role ID", required=False, max_length=24)
     muted = discord.ui.TextInput(label="Muted/Punishment role ID", required=False, max_length=24)
     ranks = discord.ui.TextInput(label="Ranks roles (comma role IDs)", required=False, max_length=200)
 
+    _MAPPING = (
+        ("roles.verified", "verified"),
+        ("roles.muted", "muted"),
+        ("roles.punishment", "muted"),  # Keep for backwards compatibility
+        ("roles.ranks", "ranks"),
+    )
+    _TITLE = "Config Roles"
+
     def __init__(self, bot: commands.Bot):
         super().__init__()
         self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
-        gid = interaction.guild_id
-        if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        await cfg_set(self.bot.db, gid, "roles.verified", self.verified.value.strip())
-        mute_value = self.muted.value.strip()
-        await cfg_set(self.bot.db, gid, "roles.muted", mute_value)
-        await cfg_set(self.bot.db, gid, "roles.punishment", mute_value)  # Keep for backwards compatibility
-        await cfg_set(self.bot.db, gid, "roles.ranks", self.ranks.value.strip())
-        embed = create_embed("Saved.\n᲼᲼", title="Config Roles", color="success", is_dm=False, is_system=False)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await self._save(interaction)
 
-class ChannelsModal(discord.ui.Modal, title="Config: Channels"):
+class ChannelsModal(_SaveMixin, discord.ui.Modal, title="Config: Channels"):
     logs = discord.ui.TextInput(label="Logs channel ID", required=False, max_length=24)
     announcements = discord.ui.TextInput(label="Announcements channel ID", required=False, max_length=24)
     orders = discord.ui.TextInput(label="Orders channel ID", required=False, max_length=24)
     intros = discord.ui.TextInput(label="Introductions/Confession channel ID", required=False, max_length=24)
     spam = discord.ui.TextInput(label="Bot spam channel ID", required=False, max_length=24)
 
+    _MAPPING = (
+        ("channels.logs", "logs"),
+        ("channels.announcements", "announcements"),
+        ("channels.orders", "orders"),
+        ("channels.intros", "intros"),
+        ("channels.spam", "spam"),
+    )
+    _TITLE = "Config Channels"
+
     def __init__(self, bot: commands.Bot):
         super().__init__()
         self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
-        gid = interaction.guild_id
-        if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        await cfg_set(self.bot.db, gid, "channels.logs", self.logs.value.strip())
-        await cfg_set(self.bot.db, gid, "channels.announcements", self.announcements.value.strip())
-        await cfg_set(self.bot.db, gid, "channels.orders", self.orders.value.strip())
-        await cfg_set(self.bot.db, gid, "channels.intros", self.intros.value.strip())
-        await cfg_set(self.bot.db, gid, "channels.spam", self.spam.value.strip())
-        embed = create_embed("Saved.\n᲼᲼", title="Config Channels", color="success", is_dm=False, is_system=False)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await self._save(interaction)
 
-class EconomyModal(discord.ui.Modal, title="Config: Economy"):
+class EconomyModal(_SaveMixin, discord.ui.Modal, title="Config: Economy"):
     daily_amount = discord.ui.TextInput(label="Daily coin base amount", default="80", max_length=10)
     streak_step = discord.ui.TextInput(label="Streak bonus per day (coins)", default="10", max_length=10)
     transfer_limit = discord.ui.TextInput(label="Transfer limit per day", default="500", max_length=10)
     gambling_limit = discord.ui.TextInput(label="Gambling max bet (0=none)", default="0", max_length=10)
     tax_rule = discord.ui.TextInput(label="Tax rule preset (simple/custom)", default="simple", max_length=20)
 
+    _MAPPING = (
+        ("economy.daily_base", "daily_amount"),
+        ("economy.streak_step", "streak_step"),
+        ("economy.transfer_limit", "transfer_limit"),
+        ("economy.gambling_limit", "gambling_limit"),
+        ("economy.tax_rule", "tax_rule"),
+    )
+    _TITLE = "Config Economy"
+
     def __init__(self, bot: commands.Bot):
         super().__init__()
         self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
-        gid = interaction.guild_id
-        if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        await cfg_set(self.bot.db, gid, "economy.daily_base", self.daily_amount.value.strip())
-        await cfg_set(self.bot.db, gid, "economy.streak_step", self.streak_step.value.strip())
-        await cfg_set(self.bot.db, gid, "economy.transfer_limit", self.transfer_limit.value.strip())
-        await cfg_set(self.bot.db, gid, "economy.gambling_limit", self.gambling_limit.value.strip())
-        await cfg_set(self.bot.db, gid, "economy.tax_rule", self.tax_rule.value.strip())
-        embed = create_embed("Saved.\n᲼᲼", title="Config Economy", color="success", is_dm=False, is_system=False)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await self._save(interaction)
 
-class OrdersModal(discord.ui.Modal, title="Config: Orders"):
+class OrdersModal(_SaveMixin, discord.ui.Modal, title="Config: Orders"):
     frequency = discord.ui.TextInput(label="Order frequency (e.g., hourly / daily)", default="daily", max_length=20)
     allowed_types = discord.ui.TextInput(label="Allowed types (comma): hourly,daily,event,personal", default="hourly,daily,event,personal", max_length=100)
     windows = discord.ui.TextInput(label="Time windows (UK) e.g. 09:00-23:00", default="09:00-23:00", max_length=30)
     penalties = discord.ui.TextInput(label="Default penalties (coins,obed) e.g. 50,10", default="50,10", max_length=20)
     rewards = discord.ui.TextInput(label="Reward multiplier e.g. 1.0", default="1.0", max_length=10)
 
+    _MAPPING = (
+        ("orders.frequency", "frequency"),
+        ("orders.allowed_types", "allowed_types"),
+        ("orders.windows", "windows"),
+        ("orders.penalties", "penalties"),
+        ("orders.reward_mult", "rewards"),
+    )
+    _TITLE = "Config Orders"
+
     def __init__(self, bot: commands.Bot):
         super().__init__()
         self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
-        gid = interaction.guild_id
-        if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        await cfg_set(self.bot.db, gid, "orders.frequency", self.frequency.value.strip())
-        await cfg_set(self.bot.db, gid, "orders.allowed_types", self.allowed_types.value.strip())
-        await cfg_set(self.bot.db, gid, "orders.windows", self.windows.value.strip())
-        await cfg_set(self.bot.db, gid, "orders.penalties", self.penalties.value.strip())
-        await cfg_set(self.bot.db, gid, "orders.reward_mult", self.rewards.value.strip())
-        embed = create_embed("Saved.\n᲼᲼", title="Config Orders", color="success", is_dm=False, is_system=False)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await self._save(interaction)
 
-class ModerationModal(discord.ui.Modal, title="Config: Moderation"):
+class ModerationModal(_SaveMixin, discord.ui.Modal, title="Config: Moderation"):
     filters = discord.ui.TextInput(label="Filters preset (off/basic/strict)", default="basic", max_length=20)
     antispam = discord.ui.TextInput(label="Anti-spam sensitivity (1-10)", default="5", max_length=2)
     escalation = discord.ui.TextInput(label="Escalation thresholds (e.g. 3=10m,5=1h,7=24h)", default="3=10m,5=1h,7=24h", max_length=120)
     raid = discord.ui.TextInput(label="Raid mode behavior (off/lockdown/slowmode)", default="off", max_length=20)
     notes = discord.ui.TextInput(label="Notes (optional)", required=False, style=discord.TextStyle.long, max_length=400)
 
+    _MAPPING = (
+        ("mod.filters", "filters"),
+        ("mod.antispam", "antispam"),
+        ("mod.escalation", "escalation"),
+        ("mod.raid", "raid"),
+        ("mod.notes", "notes"),
+    )
+    _TITLE = "Config Moderation"
+
     def __init__(self, bot: commands.Bot):
         super().__init__()
         self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
-        gid = interaction.guild_id
-        if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        await cfg_set(self.bot.db, gid, "mod.filters", self.filters.value.strip())
-        await cfg_set(self.bot.db, gid, "mod.antispam", self.antispam.value.strip())
-        await cfg_set(self.bot.db, gid, "mod.escalation", self.escalation.value.strip())
-        await cfg_set(self.bot.db, gid, "mod.raid", self.raid.value.strip())
-        await cfg_set(self.bot.db, gid, "mod.notes", self.notes.value.strip())
-        embed = create_embed("Saved.\n᲼᲼", title="Config Moderation", color="success", is_dm=False, is_system=False)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await self._save(interaction)
 
 # ---------- Onboarding Subgroup ----------
 class OnboardingConfigGroup(app_commands.Group):
@@ -154,11 +171,9 @@ class OnboardingConfigGroup(app_commands.Group):
     @app_commands.describe(channel="The channel for onboarding messages")
     async def channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
         if not interaction.guild or not isinstance(interaction.user, discord.Member):
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_SERVER_ONLY_EMBED, ephemeral=True)
         if not is_admin(interaction.user):
-            embed = create_embed("Not for you.\n᲼᲼", title="Config", color="error", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NOT_FOR_YOU_EMBED, ephemeral=True)
         gid = interaction.guild.id
         await cfg_set(self.bot.db, gid, "onboarding.channel", str(channel.id))
         embed = create_embed(f"Onboarding channel set to {channel.mention}.\n᲼᲼", title="Config Onboarding", color="success", is_dm=False, is_system=False)
@@ -173,11 +188,9 @@ class OnboardingConfigGroup(app_commands.Group):
     ])
     async def role(self, interaction: discord.Interaction, role_type: app_commands.Choice[str], role: discord.Role):
         if not interaction.guild or not isinstance(interaction.user, discord.Member):
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_SERVER_ONLY_EMBED, ephemeral=True)
         if not is_admin(interaction.user):
-            embed = create_embed("Not for you.\n᲼᲼", title="Config", color="error", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NOT_FOR_YOU_EMBED, ephemeral=True)
         gid = interaction.guild.id
         await cfg_set(self.bot.db, gid, f"onboarding.role_{role_type.value}", str(role.id))
         embed = create_embed(f"{role_type.name} role set to {role.mention}.\n᲼᲼", title="Config Onboarding", color="success", is_dm=False, is_system=False)
@@ -230,15 +243,13 @@ class Admin(commands.Cog):
     
     async def _require_admin(self, interaction: discord.Interaction) -> bool:
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return False
         return True
     
     async def _require_mod(self, interaction: discord.Interaction) -> bool:
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return False
         return True
     
@@ -297,8 +308,7 @@ class Admin(commands.Cog):
     @app_commands.command(name="feature_list", description="(Mod) List feature flags (available modules).")
     async def feature_list(self, interaction: discord.Interaction):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         lines = [f"- `{k}`: {v}" for k, v in FEATURES.items()]
@@ -308,14 +318,12 @@ class Admin(commands.Cog):
     @app_commands.describe(feature="Feature name", enabled="Enable or disable")
     async def feature_set(self, interaction: discord.Interaction, feature: str, enabled: bool):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
         if feature not in FEATURES:
-            embed = create_embed("Unknown feature. Use /feature_list.", color="info", is_dm=False, is_system=False)
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=_UNKNOWN_FEATURE_EMBED, ephemeral=True)
             return
         await self.bot.flags.set_guild(gid, feature, enabled)
         await self.bot.db.audit(gid, interaction.user.id, None, "toggle_feature_guild", json.dumps({"feature": feature, "enabled": enabled}), now_ts())
@@ -326,14 +334,12 @@ class Admin(commands.Cog):
     @app_commands.describe(feature="Feature name", channel="Channel to configure", enabled="Enable or disable")
     async def feature_set_channel(self, interaction: discord.Interaction, feature: str, channel: discord.TextChannel, enabled: bool):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
         if feature not in FEATURES:
-            embed = create_embed("Unknown feature. Use /feature_list.", color="info", is_dm=False, is_system=False)
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=_UNKNOWN_FEATURE_EMBED, ephemeral=True)
             return
         await self.bot.flags.set_channel(gid, channel.id, feature, enabled)
         await self.bot.db.audit(gid, interaction.user.id, None, "toggle_feature_channel", json.dumps({"feature": feature, "channel_id": channel.id, "enabled": enabled}), now_ts())
@@ -348,8 +354,7 @@ class Admin(commands.Cog):
     @app_commands.describe(channel="Channel to configure", key="Config key", value="Config value")
     async def channelcfg_set(self, interaction: discord.Interaction, channel: discord.TextChannel, key: str, value: str):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
@@ -362,8 +367,7 @@ class Admin(commands.Cog):
     @app_commands.describe(channel="Channel to check", key="Config key")
     async def channelcfg_get(self, interaction: discord.Interaction, channel: discord.TextChannel, key: str):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
@@ -375,8 +379,7 @@ class Admin(commands.Cog):
     @app_commands.describe(channel="Channel to configure", key="Config key to delete")
     async def channelcfg_del(self, interaction: discord.Interaction, channel: discord.TextChannel, key: str):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
@@ -393,8 +396,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to note", note="Note text")
     async def note_set(self, interaction: discord.Interaction, user: discord.Member, note: str):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid, uid = interaction.guild.id, user.id
@@ -413,8 +415,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to view")
     async def note_view(self, interaction: discord.Interaction, user: discord.Member):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid, uid = interaction.guild.id, user.id
@@ -464,8 +465,7 @@ class Admin(commands.Cog):
         gid = interaction.guild_id
         uid = interaction.user.id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         rows = await self.bot.db.fetchall(
             "SELECT id, kind, reason, created_ts, ends_ts, conditions FROM discipline_punishments WHERE guild_id=? AND user_id=? AND active=1 ORDER BY created_ts DESC",
@@ -497,8 +497,7 @@ class Admin(commands.Cog):
         gid = interaction.guild_id
         uid = interaction.user.id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         await self._ensure_debt(gid, uid)
         d = await self.bot.db.fetchone("SELECT debt FROM discipline_debt WHERE guild_id=? AND user_id=?", (gid, uid))
@@ -519,8 +518,7 @@ class Admin(commands.Cog):
         gid = interaction.guild_id
         uid = interaction.user.id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         await self._ensure_debt(gid, uid)
         d = await self.bot.db.fetchone("SELECT debt FROM discipline_debt WHERE guild_id=? AND user_id=?", (gid, uid))
@@ -840,8 +838,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to discipline", kind="Type: warning|discipline|strike", points="Points (1-10)", reason="Reason (optional)")
     async def discipline_add(self, interaction: discord.Interaction, user: discord.Member, kind: str, points: app_commands.Range[int, 1, 10] = 1, reason: str | None = None):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         kind = kind.lower().strip()
@@ -863,8 +860,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to view", limit="Number of recent entries (1-10)")
     async def discipline_view(self, interaction: discord.Interaction, user: discord.Member, limit: app_commands.Range[int, 1, 10] = 5):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid, uid = interaction.guild.id, user.id
@@ -896,14 +892,13 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to view")
     async def admin_profile(self, interaction: discord.Interaction, user: discord.Member):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid, uid = interaction.guild.id, user.id
         await self.bot.db.ensure_user(gid, uid)
         u = await self.bot.db.fetchone("SELECT coins,lce,debt,stage,last_msg_ts FROM users WHERE guild_id=? AND user_id=?", (gid, uid))
-        c = await self.bot.db.fetchone("SELECT * FROM consent WHERE guild_id=? AND user_id=?", (gid, uid))
+        c = await self.bot.db.fetchone("SELECT verified_18,opt_orders,opt_dm,opt_humiliation FROM consent WHERE guild_id=? AND user_id=?", (gid, uid))
         note = await self.bot.db.fetchone("SELECT note,created_ts,updated_ts FROM user_admin_notes WHERE guild_id=? AND user_id=?", (gid, uid))
         today = day_key()
         rows = await self.bot.db.fetchall(
@@ -948,14 +943,14 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to opt-out", reason="Reason (optional)")
     async def user_optout(self, interaction: discord.Interaction, user: discord.Member, reason: str | None = None):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
         target_id = user.id
         await self.bot.db.audit(gid, actor_id=interaction.user.id, target_user_id=target_id, action="admin_user_optout_requested", meta=json.dumps({"reason": (reason or "")[:500]}), ts=now_ts())
         await self.bot.db.hard_delete_user(gid, target_id)
+        self.bot.dispatch("user_stats_changed", gid, target_id)
         await self.bot.db.set_optout(gid, target_id, True, now_ts())
         await self.bot.db.audit(gid, actor_id=interaction.user.id, target_user_id=target_id, action="admin_user_optout_completed", meta=json.dumps({"reason": (reason or "")[:500]}), ts=now_ts())
         try:
@@ -968,8 +963,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to opt-in", reason="Reason (optional)")
     async def user_optin(self, interaction: discord.Interaction, user: discord.Member, reason: str | None = None):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
@@ -987,8 +981,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to apply safeword to", minutes="Duration in minutes (5-10080)", reason="Reason (optional)")
     async def user_safeword(self, interaction: discord.Interaction, user: discord.Member, minutes: app_commands.Range[int, 5, 10080] = 60, reason: str | None = None):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
@@ -1006,8 +999,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to clear safeword for", reason="Reason (optional)")
     async def user_unsafeword(self, interaction: discord.Interaction, user: discord.Member, reason: str | None = None):
         if not interaction.guild or not self._is_admin(interaction):
-            embed = create_embed("Admin only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_ADMIN_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild.id
@@ -1024,8 +1016,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="User to check")
     async def user_status(self, interaction: discord.Interaction, user: discord.Member):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         gid, uid = interaction.guild.id, user.id
@@ -1051,8 +1042,7 @@ class Admin(commands.Cog):
     @app_commands.describe(user="Filter by target user", actor="Filter by actor (who performed the action)", action="Filter by action type", days="Number of days to look back (default: 7)", limit="Maximum results (1-100, default: 50)")
     async def audit_view(self, interaction: discord.Interaction, user: discord.Member | None = None, actor: discord.Member | None = None, action: str | None = None, days: app_commands.Range[int, 1, 90] = 7, limit: app_commands.Range[int, 1, 100] = 50):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         from utils.audit import AuditService
@@ -1078,8 +1068,7 @@ class Admin(commands.Cog):
     @app_commands.choices(format=[app_commands.Choice(name="CSV", value="csv"), app_commands.Choice(name="JSON", value="json")])
     async def audit_export(self, interaction: discord.Interaction, format: app_commands.Choice[str], days: app_commands.Range[int, 1, 90] = 30):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         from utils.audit import AuditService
@@ -1098,8 +1087,7 @@ class Admin(commands.Cog):
     @app_commands.describe(days="Number of days to analyze (default: 30)")
     async def audit_stats(self, interaction: discord.Interaction, days: app_commands.Range[int, 1, 90] = 30):
         if not interaction.guild or not self._is_mod(interaction):
-            embed = create_embed("Mods only.", color="info", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_MODS_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
         from utils.audit import AuditService
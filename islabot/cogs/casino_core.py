@@ -5,13 +5,17 @@ Consolidates: casino_core, casino_games, casino_bigwin_dm, casino_royalty
 
 from __future__ import annotations
 
+import asyncio
 import json
 import random
-import math
+import functools
+import itertools
+import sys
+from collections import OrderedDict
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
-from datetime import datetime, time, timedelta
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from core.utility import now_ts, now_local, fmt
@@ -20,6 +24,9 @@ from utils.embed_utils import create_embed
 
 UK_TZ = ZoneInfo("Europe/London")
 
+# Module-level RNG for line/thumbnail picks (avoids random.choice on the shared instance)
+_RNG = random.Random()
+
 # Casino thumbnails
 CASINO_THUMBS = [
     "https://i.imgur.com/jzk6IfH.png",
@@ -47,25 +54,168 @@ SPOTLIGHT_PRESTIGE_LINES = [
     "Prestige collar claimed.\n{user} didn't hesitate.\n᲼᲼",
 ]
 
+# Prestige announcement constants (lines are sanitized once; the {user} ping is filled per post)
+_PRESTIGE_COLOR = discord.Color.from_rgb(190, 40, 40)
+_PRESTIGE_LINES_SANITIZED = tuple(sanitize_isla_text(line) for line in SPOTLIGHT_PRESTIGE_LINES)
+
+# Slots symbols are drawn as indices 0-5 (cherry..crown) with cumulative weights 35/30/18/10/6/1;
+# glyphs are only looked up for display
+_SLOTS_GLYPH = ("🍒", "🍋", "🍇", "🔔", "💎", "👑")
+_SLOTS_IDX = range(len(_SLOTS_GLYPH))
+_SLOTS_CUM = tuple(itertools.accumulate((35, 30, 18, 10, 6, 1)))
+_SLOTS_CHERRY_BIT = 1 << 0
+_SLOTS_CROWN = 5
+# Three-of-a-kind multipliers by symbol index: /slots and the /allin slots table
+_SLOTS_TIER = (2, 2, 3, 5, 8, 20)
+_ALLIN_SLOTS_TIER = (3, 5, 10, 20, 50, 100)
+
+# Payout multipliers in basis points (1/10000) so payouts stay in integer math: wager * BP // _BP
+_BP = 10000
+_COINFLIP_PAYOUT_BP = 19500
+_ROULETTE_EVEN_BP = 19000
+_ROULETTE_GREEN_BP = 330000
+_ROULETTE_NUMBER_BP = 330000
+_BJ_WIN_BP = 19500
+_BJ_BLACKJACK_BP = 23500
+_SLOTS_CHERRY_BP = 3500
+_ALLIN_SLOTS_PAIR_BP = 15000
+_CRASH_EDGE_BP = 9800
+# Dice payout by target (2-6): fair odds 6/(7-target) less a 6% edge
+_DICE_BP = tuple(0 if t < 2 else 6 * 9400 // (7 - t) for t in range(7))
+
+# Blackjack ranks/values and roulette red numbers
+_BJ_RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+_BJ_VALUES = {"A": 11, "J": 10, "Q": 10, "K": 10, **{str(i): i for i in range(2, 11)}}
+_ROULETTE_REDS = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+
+def _deal_blackjack(rng: random.Random) -> tuple[list[str], list[str], int, int]:
+    """Deal player/dealer hands from one batched draw; dealer hits below 17."""
+    deck = rng.choices(_BJ_RANKS, k=8)
+    player = deck[0:2]
+    dealer = deck[2:4]
+    # Two cards only go over 21 as a pair of aces, which counts as 12
+    pv = _BJ_VALUES[deck[0]] + _BJ_VALUES[deck[1]]
+    if pv == 22:
+        pv = 12
+    dv = _BJ_VALUES[deck[2]] + _BJ_VALUES[deck[3]]
+    # Aces still counted as 11 in the dealer total
+    soft = (deck[2] == "A") + (deck[3] == "A")
+    if dv == 22:
+        dv = 12
+        soft = 1
+    idx = 4
+    while dv < 17:
+        if idx == len(deck):
+            deck.extend(rng.choices(_BJ_RANKS, k=8))
+        card = deck[idx]
+        idx += 1
+        dealer.append(card)
+        dv += _BJ_VALUES[card]
+        if card == "A":
+            soft += 1
+        while dv > 21 and soft:
+            dv -= 10
+            soft -= 1
+    return player, dealer, pv, dv
+
+def _roulette_color(wager: int, spin: int, color: str, number: int | None, bet_type: str) -> tuple[int, bool, bool]:
+    win = (color == bet_type)
+    if win:
+        return wager * (_ROULETTE_GREEN_BP if bet_type == "green" else _ROULETTE_EVEN_BP) // _BP, True, False
+    return 0, False, color == "green" and bet_type != "green"
+
+def _roulette_parity(wager: int, spin: int, color: str, number: int | None, bet_type: str) -> tuple[int, bool, bool]:
+    if spin == 0:
+        return 0, False, True
+    win = (spin % 2 == 0) == (bet_type == "even")
+    return (wager * _ROULETTE_EVEN_BP // _BP if win else 0), win, False
+
+def _roulette_number(wager: int, spin: int, color: str, number: int | None, bet_type: str) -> tuple[int, bool, bool]:
+    if spin == number:
+        return wager * _ROULETTE_NUMBER_BP // _BP, True, False
+    return 0, False, spin != 0 and number != 0 and abs(spin - number) == 1
+
+# bet_type -> resolver returning (payout, win, near_miss) for a spin
+_ROULETTE_HANDLERS = {
+    "red": _roulette_color,
+    "black": _roulette_color,
+    "green": _roulette_color,
+    "odd": _roulette_parity,
+    "even": _roulette_parity,
+    "number": _roulette_number,
+}
+
+def _resolve_blackjack(wager: int, pv: int, dv: int, n_player: int, n_dealer: int) -> tuple[int, str, bool]:
+    """Resolve final blackjack totals. Returns (payout, outcome, near_miss)."""
+    if pv == 21 and n_player == 2 and not (dv == 21 and n_dealer == 2):
+        payout = wager * _BJ_BLACKJACK_BP // _BP
+        outcome = "blackjack"
+    elif pv > 21:
+        payout = 0
+        outcome = "bust"
+    elif dv > 21:
+        payout = wager * _BJ_WIN_BP // _BP
+        outcome = "dealer_bust"
+    elif pv > dv:
+        payout = wager * _BJ_WIN_BP // _BP
+        outcome = "win"
+    elif pv < dv:
+        payout = 0
+        outcome = "loss"
+    else:
+        payout = wager
+        outcome = "push"
+    near_miss = outcome in ("loss", "bust") and pv >= 19
+    return payout, outcome, near_miss
+
+# Concurrent member edits (across all guilds) during the weekly royalty rotation
+_ROLE_EDIT_CONCURRENCY = 5
+
+# Weekly royalty runs Monday 12:10 UK; the last awarded week is kept in kv_store so a restart never repeats it
+_AWARDS_HOUR, _AWARDS_MINUTE = 12, 10
+_AWARDS_KV_KEY = "casino_royalty_last_week"
+# Weeks missed while the bot was down are awarded on the next start, oldest first, up to this many
+_AWARDS_CATCHUP_WEEKS = 4
+_AWARDS_RETRY = timedelta(minutes=10)
+
+# Weekly royalty spotlight post openers/closers
+_SPOTLIGHT_FLAVOR = ("I checked the tables.", "I looked at the casino logs.", "I peeked at who couldn't resist.")
+_SPOTLIGHT_CLOSER = ("Try to catch them.", "If you want my attention, you know what to do.", "Next week I expect better.")
+
 ROLE_NAMES = [
     "Casino Royalty I",
     "Casino Royalty II",
     "Casino Royalty III"
 ]
 
+_CASINO_THUMBS_LEN = len(CASINO_THUMBS)
+
+_CASINO_DESC_TEMPLATE = (
+    "{mention}\n"
+    "{invite}\n"
+    "\n"
+    "**Games**\n"
+    "• `/coinflip` • `/dice` • `/roulette` • `/slots` • `/crash` • `/blackjack`\n"
+    "\n"
+    "Balance: **{coins} Coins**\n"
+    "᲼᲼"
+)
+
 # Helper functions
 def casino_embed(desc: str, icon: str) -> discord.Embed:
-    e = discord.Embed(description=sanitize_isla_text(desc))
-    e.set_author(name="Isla", icon_url=icon)
-    e.set_thumbnail(url=random.choice(CASINO_THUMBS))
-    return e
+    # Built from a dict in one pass instead of going through the property setters
+    return discord.Embed.from_dict({
+        "description": sanitize_isla_text(desc),
+        "author": {"name": "Isla", "icon_url": icon},
+        "thumbnail": {"url": CASINO_THUMBS[_RNG.randrange(_CASINO_THUMBS_LEN)]},
+    })
 
 def dm_embed(desc: str, icon: str) -> discord.Embed:
     """Create a DM embed (includes author)."""
     return create_embed(
         description=sanitize_isla_text(desc),
         color="casino",
-        thumbnail=random.choice(CASINO_THUMBS),
+        thumbnail=CASINO_THUMBS[_RNG.randrange(_CASINO_THUMBS_LEN)],
         is_dm=True,
         is_system=False
     )
@@ -84,9 +234,22 @@ def prev_week_key_uk() -> str:
     iso_year, iso_week, _ = t.isocalendar()
     return f"{iso_year}-{iso_week:02d}"
 
+def awards_slot_uk(t: datetime) -> datetime:
+    """The latest Monday 12:10 UK at or before t."""
+    slot = (t - timedelta(days=t.weekday())).replace(hour=_AWARDS_HOUR, minute=_AWARDS_MINUTE, second=0, microsecond=0)
+    if t < slot:
+        slot -= timedelta(days=7)
+    return slot
+
+def awards_week_key(slot: datetime) -> str:
+    """ISO week awarded at slot: the week that ended the day before."""
+    iso_year, iso_week, _ = (slot - timedelta(days=1)).isocalendar()
+    return f"{iso_year}-{iso_week:02d}"
+
 def clamp_int(n: int, a: int, b: int) -> int:
     return max(a, min(b, n))
 
+@functools.lru_cache(maxsize=8192)
 def stage_from_stats(obedience: int, lce: int) -> int:
     score = obedience + (lce * 2)
     if score < 800:
@@ -99,12 +262,6 @@ def stage_from_stats(obedience: int, lce: int) -> int:
         return 3
     return 4
 
-def big_win(wager: int, net: int) -> bool:
-    return net >= max(2000, int(wager * 3.0))
-
-def big_loss(wager: int, net: int) -> bool:
-    return (-net) >= max(2000, int(wager * 2.5))
-
 def near_miss_flag(game: str, meta: dict) -> bool:
     if game == "slots":
         return bool(meta.get("near_miss"))
@@ -308,6 +465,159 @@ LINES = {
     },
 }
 
+# Keys whose lines only start at stage 2 (lower stages reuse the stage-2 pool)
+_MIN_STAGE_2_KEYS = frozenset((
+    "casino_win_streak", "casino_loss_streak_break", "dice_high_win", "dice_low_loss",
+    "slots_small_win", "slots_big_win", "slots_no_win",
+))
+
+
+def _build_pools() -> dict[tuple[str, int], tuple[tuple[str, ...], int]]:
+    """
+    Resolve every (key, stage 0-4) to its (tuple, len) pool once, with the stage-2
+    fallback and minimum-stage rules baked in. Keys and lines are interned so every
+    round shares the same string objects.
+    """
+    pools = {}
+    for key, by_stage in LINES.items():
+        for stage in range(5):
+            src = 2 if (key in _MIN_STAGE_2_KEYS and stage < 2) else stage
+            pool = by_stage.get(src) or by_stage.get(2)
+            if pool:
+                pools[(sys.intern(key), stage)] = (tuple(sys.intern(line) for line in pool), len(pool))
+    return pools
+
+
+_POOLS = _build_pools()
+_FALLBACK_POOL = (("...",), 1)
+
+# Alternate pools used when filter_all_in is set (the all-in flirt line is only for real all-ins)
+_BET_CONFIRM_NO_ALLIN = tuple(
+    line for line in _POOLS[("casino_bet_confirm", 4)][0]
+    if "I love when you go all in for me" not in line
+)
+_FILTERED_POOLS = {
+    ("casino_bet_confirm", 4): (_BET_CONFIRM_NO_ALLIN, len(_BET_CONFIRM_NO_ALLIN)),
+}
+
+# Game -> invite line key
+_INVITE_KEYS = {
+    sys.intern(game): sys.intern(key)
+    for game, key in (
+        ("blackjack", "casino_invite_blackjack"),
+        ("dice", "casino_invite_dice"),
+        ("roulette", "casino_invite_roulette"),
+        ("slots", "casino_invite_slots"),
+    )
+}
+
+
+def guild_defer(ephemeral: bool = False, check=None):
+    """Reject casino commands outside a guild, run the command's validation, then defer.
+
+    `check(cog, interaction, **params)` returns an error (str or Embed) or None. Errors go out as the
+    initial ephemeral response: a followup after a public defer would be posted in the channel.
+    """
+    def deco(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            if not interaction.guild_id:
+                embed = create_embed("Use this in a server.", color="info", is_dm=False, is_system=False)
+                return await interaction.response.send_message(embed=embed, ephemeral=True)
+            if check is not None:
+                err = await check(self, interaction, *args, **kwargs)
+                if isinstance(err, discord.Embed):
+                    return await interaction.response.send_message(embed=err, ephemeral=True)
+                if err:
+                    return await interaction.response.send_message(err, ephemeral=True)
+            await interaction.response.defer(ephemeral=ephemeral)
+            return await func(self, interaction, *args, **kwargs)
+        return wrapper
+    return deco
+
+
+def _check_error(msg: str) -> discord.Embed:
+    return create_embed(msg, color="info", is_dm=False, is_system=False)
+
+
+async def _check_wager(cog, interaction: discord.Interaction, wager: int):
+    ok, msg = await cog._validate_wager(interaction, wager)
+    return None if ok else msg
+
+
+async def _check_coinflip(cog, interaction: discord.Interaction, wager: int, pick: str):
+    return await _check_wager(cog, interaction, wager) or (
+        None if pick.lower().strip() in ("heads", "tails") else _check_error("Pick must be heads or tails.")
+    )
+
+
+async def _check_dice(cog, interaction: discord.Interaction, wager: int, target: int):
+    return await _check_wager(cog, interaction, wager) or (
+        _check_error("Target must be 2–6.") if target < 2 or target > 6 else None
+    )
+
+
+async def _check_roulette(cog, interaction: discord.Interaction, wager: int, bet_type: str, number: int | None = None):
+    err = await _check_wager(cog, interaction, wager)
+    if err:
+        return err
+    bet_type = bet_type.lower().strip()
+    if bet_type not in _ROULETTE_HANDLERS:
+        return _check_error("Invalid bet_type.")
+    if bet_type == "number" and (number is None or number < 0 or number > 36):
+        return _check_error("Number must be 0–36.")
+    return None
+
+
+async def _check_crash(cog, interaction: discord.Interaction, wager: int, target: float):
+    return await _check_wager(cog, interaction, wager) or (
+        _check_error("Target must be 1.10–10.00.") if not 110 <= round(target * 100) <= 1000 else None
+    )
+
+
+def _log_failures(results, what: str):
+    """Log every exception returned by asyncio.gather(..., return_exceptions=True)."""
+    for r in results:
+        if isinstance(r, BaseException):
+            print(f"ERROR: {what}: {type(r).__name__}: {r}")
+
+
+class _FmtArgs(dict):
+    """format_map() args that leave placeholders without a value as literal {name}."""
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+# Hot-path SQL kept as module constants so each round reuses the same statement text
+# (sqlite3's per-connection statement cache then skips re-parsing/planning).
+_STATS_CACHE_MAX = 4096
+_STATS_CACHE_TTL = 30
+
+_ALLIN_COOLDOWN = 120
+# _allin_last is swept of lapsed cooldowns whenever it grows past this many entries
+_ALLIN_SWEEP_AT = 1024
+
+_SQL_ALLIN_STATE = "SELECT coins, last_allin_ts FROM users WHERE guild_id=? AND user_id=? LIMIT 1"
+_SQL_ALLIN_CLAIM = (
+    "UPDATE users SET last_allin_ts=? "
+    "WHERE guild_id=? AND user_id=? AND coins > 0 AND (last_allin_ts IS NULL OR last_allin_ts <= ?) "
+    "RETURNING coins"
+)
+# Relative write: a concurrent coins change by another cog is kept, not overwritten with a cached balance
+_SQL_ADD_COINS = "UPDATE users SET coins = MAX(0, coins + ?) WHERE guild_id=? AND user_id=?"
+_SQL_TOUCH_WEEKLY = "INSERT OR IGNORE INTO weekly_stats(guild_id,week_key,user_id) VALUES(?,?,?)"
+_SQL_ADD_WEEKLY_WAGER = "UPDATE weekly_stats SET casino_wagered = casino_wagered + ? WHERE guild_id=? AND week_key=? AND user_id=?"
+_SQL_CASINO_STATE = (
+    "INSERT INTO casino_user_state(guild_id,user_id,win_streak,loss_streak,last_net,last_play_ts) "
+    "VALUES(?,?,0,0,0,0) "
+    "ON CONFLICT(guild_id,user_id) DO UPDATE SET user_id=user_id "
+    "RETURNING win_streak, loss_streak, last_net, last_play_ts"
+)
+_SQL_SET_CASINO_STATE = "UPDATE casino_user_state SET win_streak=?, loss_streak=?, last_net=?, last_play_ts=? WHERE guild_id=? AND user_id=?"
+_SQL_ENSURE_ACHIEVEMENT = "INSERT OR IGNORE INTO achievements(guild_id,user_id,key,value,updated_ts) VALUES(?,?,?,?,?)"
+_SQL_BUMP_ACHIEVEMENT = "UPDATE achievements SET value = value + ?, updated_ts=? WHERE guild_id=? AND user_id=? AND key=?"
+_SQL_GET_ACHIEVEMENT = "SELECT value FROM achievements WHERE guild_id=? AND user_id=? AND key=?"
+
 
 class CasinoCore(commands.Cog):
     """
@@ -317,10 +627,42 @@ class CasinoCore(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.icon = "https://i.imgur.com/5nsuuCV.png"
+        # (guild_id, channel_id) -> spotlight channel
+        self._spotlight_channels: dict[tuple[int, int], discord.TextChannel] = {}
+        # LRU of (guild_id, user_id) -> (coins, obedience, lce, xp, expiry_ts); kept in sync by
+        # _cache_coins and dropped on "user_stats_changed" events dispatched by other cogs writing users
+        self._stats_cache: OrderedDict[tuple[int, int], tuple[int, int, int, int, int]] = OrderedDict()
+        # (guild_id, user_id) -> last all-in ts; turns away repeat /allin calls without a DB round trip.
+        # Lapsed entries are dropped when checked and swept once the dict passes _ALLIN_SWEEP_AT
+        self._allin_last: dict[tuple[int, int], int] = {}
+        # Fire-and-forget DB writes; held here so they are not garbage collected mid-flight
+        self._pending_writes: set[asyncio.Task] = set()
+        # (guild_id, user_id) -> that user's in-flight _persist_round; the next round waits on it before reading
+        self._round_writes: dict[tuple[int, int], asyncio.Task] = {}
+        # Generator for game outcomes (flavor lines and thumbnails use the module _RNG)
+        self._rng = random.Random()
+        # Caps concurrent role edits across guilds during the weekly royalty rotation
+        self._sem = asyncio.Semaphore(_ROLE_EDIT_CONCURRENCY)
         self.weekly_awards.start()
     
-    def cog_unload(self):
+    async def cog_unload(self):
         self.weekly_awards.cancel()
+        # Bot.close unloads cogs before it closes the database, so draining here lets
+        # in-flight background writes land instead of hitting a closed connection
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+    
+    def _spawn_write(self, coro):
+        """Run a DB write off the response path, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._write_done)
+        return task
+    
+    def _write_done(self, task: asyncio.Task):
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"ERROR: Casino background write failed: {task.exception()}")
 
     async def get_recent_user_highlight(self, guild_id: int, user_id: int, since_ts: int) -> dict | None:
         """
@@ -328,24 +670,31 @@ class CasinoCore(commands.Cog):
         - prefers biggest net win
         - falls back to biggest wager
         """
+        highlights = await self.get_recent_highlights(guild_id, (user_id,), since_ts)
+        return highlights.get(int(user_id))
+
+    async def get_recent_highlights(self, guild_id: int, user_ids, since_ts: int) -> dict[int, dict]:
+        """Same as get_recent_user_highlight for several users, in one read of the round log."""
+        wanted = {int(u) for u in user_ids}
         ctx = f"casino_rounds:{guild_id}"
         row = await self.bot.db.fetchone("SELECT hash FROM msg_memory WHERE guild_id=? AND context=?", (guild_id, ctx))
-        if not row:
-            return None
+        if not row or not wanted:
+            return {}
         try:
             data = json.loads(row["hash"]) or []
         except Exception:
-            return None
+            return {}
 
-        best_net = None
-        best_wager = None
+        best_net: dict[int, dict] = {}
+        best_wager: dict[int, dict] = {}
 
         for ev in data:
             try:
                 ts = int(ev.get("ts", 0))
                 if ts < since_ts:
                     continue
-                if int(ev.get("uid", 0)) != int(user_id):
+                uid = int(ev.get("uid", 0))
+                if uid not in wanted:
                     continue
                 wager = int(ev.get("wager", 0))
                 payout = int(ev.get("payout", 0))
@@ -363,15 +712,17 @@ class CasinoCore(commands.Cog):
                 "meta": ev.get("meta", {})
             }
 
-            if best_net is None or item["net"] > best_net["net"]:
-                best_net = item
-            if best_wager is None or item["wager"] > best_wager["wager"]:
-                best_wager = item
+            if uid not in best_net or item["net"] > best_net[uid]["net"]:
+                best_net[uid] = item
+            if uid not in best_wager or item["wager"] > best_wager[uid]["wager"]:
+                best_wager[uid] = item
 
         # Prefer net wins if any positive
-        if best_net and best_net["net"] > 0:
-            return best_net
-        return best_wager
+        out = {}
+        for uid, item in best_wager.items():
+            net_item = best_net.get(uid)
+            out[uid] = net_item if net_item and net_item["net"] > 0 else item
+        return out
 
     async def get_window_summary(self, guild_id: int, since_ts: int) -> dict:
         """
@@ -454,6 +805,7 @@ class CasinoCore(commands.Cog):
         """Log a casino round to msg_memory."""
         ctx = f"casino_rounds:{guild_id}"
         net = payout - wager
+        ts = now_ts()
         
         # Read existing data
         row = await self.bot.db.fetchone("SELECT hash FROM msg_memory WHERE guild_id=? AND context=?", (guild_id, ctx))
@@ -466,7 +818,7 @@ class CasinoCore(commands.Cog):
         
         # Append new round
         new_round = {
-            "ts": now_ts(),
+            "ts": ts,
             "uid": user_id,
             "game": game,
             "wager": wager,
@@ -488,7 +840,7 @@ class CasinoCore(commands.Cog):
             ON CONFLICT(guild_id,context)
             DO UPDATE SET hash=excluded.hash, updated_ts=excluded.updated_ts
             """,
-            (guild_id, ctx, json.dumps(data), now_ts(), now_ts())
+            (guild_id, ctx, json.dumps(data), ts, ts)
         )
     
     # =========================================================
@@ -529,36 +881,46 @@ class CasinoCore(commands.Cog):
                 (gid, uid, start, 0, 0, 0, now_ts())
             )
     
+    def _cache_stats(self, key: tuple[int, int], stats: tuple[int, int, int, int]):
+        self._stats_cache[key] = (*stats, now_ts() + _STATS_CACHE_TTL)
+        self._stats_cache.move_to_end(key)
+        if len(self._stats_cache) > _STATS_CACHE_MAX:
+            self._stats_cache.popitem(last=False)
+    
+    @commands.Cog.listener()
+    async def on_user_stats_changed(self, gid: int, uid: int):
+        """Another cog wrote coins/obedience/lce for this user; drop the cached row."""
+        self._stats_cache.pop((gid, uid), None)
+    
     async def _get_user_stats(self, gid: int, uid: int) -> tuple[int, int, int, int]:
+        key = (gid, uid)
+        cached = self._stats_cache.get(key)
+        if cached is not None and cached[4] > now_ts():
+            self._stats_cache.move_to_end(key)
+            return cached[:4]
         await self._ensure_user(gid, uid)
         row = await self.bot.db.fetchone(
             "SELECT coins, obedience, lce, xp FROM users WHERE guild_id=? AND user_id=?",
             (gid, uid)
         )
-        return (int(row["coins"]), int(row["obedience"]), int(row["lce"]), int(row["xp"]))
+        stats = (int(row["coins"]), int(row["obedience"]), int(row["lce"]), int(row["xp"]))
+        self._cache_stats(key, stats)
+        return stats
     
     async def _get_balance(self, gid: int, uid: int) -> int:
         """Get user's current coin balance."""
         coins, _, _, _ = await self._get_user_stats(gid, uid)
         return coins
     
-    async def _bump_achievement(self, gid: int, uid: int, key: str, inc: int = 1) -> int:
+    async def _bump_achievement(self, gid: int, uid: int, key: str, inc: int = 1, ts: int | None = None) -> int:
         """Bump an achievement counter and return the new value."""
-        await self.bot.db.execute(
-            "INSERT OR IGNORE INTO achievements(guild_id,user_id,key,value,updated_ts) VALUES(?,?,?,?,?)",
-            (gid, uid, key, 0, now_ts())
-        )
-        await self.bot.db.execute(
-            "UPDATE achievements SET value = value + ?, updated_ts=? WHERE guild_id=? AND user_id=? AND key=?",
-            (inc, now_ts(), gid, uid, key)
-        )
-        row = await self.bot.db.fetchone(
-            "SELECT value FROM achievements WHERE guild_id=? AND user_id=? AND key=?",
-            (gid, uid, key)
-        )
+        ts = now_ts() if ts is None else ts
+        await self.bot.db.execute(_SQL_ENSURE_ACHIEVEMENT, (gid, uid, key, 0, ts))
+        await self.bot.db.execute(_SQL_BUMP_ACHIEVEMENT, (inc, ts, gid, uid, key))
+        row = await self.bot.db.fetchone(_SQL_GET_ACHIEVEMENT, (gid, uid, key))
         return int(row["value"]) if row else 0
     
-    async def _grant_item(self, gid: int, uid: int, item_id: str):
+    async def _grant_item(self, gid: int, uid: int, item_id: str, ts: int | None = None):
         """Grant an item to a user's inventory."""
         await self.bot.db.execute(
             """
@@ -567,57 +929,87 @@ class CasinoCore(commands.Cog):
             ON CONFLICT(guild_id,user_id,item_id)
             DO UPDATE SET qty = qty + 1
             """,
-            (gid, uid, item_id, 1, now_ts())
+            (gid, uid, item_id, 1, now_ts() if ts is None else ts)
         )
     
     async def _post_spotlight_prestige(self, guild: discord.Guild, user: discord.Member):
         """Post a spotlight announcement when prestige collar is unlocked. No @everyone, only user ping."""
         spotlight_id = int(self.bot.cfg.get("channels", "spotlight", default=0) or 0)
-        channel = guild.get_channel(spotlight_id)
-        
-        if not isinstance(channel, discord.TextChannel):
-            return
+        cache_key = (guild.id, spotlight_id)
+        channel = self._spotlight_channels.get(cache_key)
+        if channel is None:
+            channel = guild.get_channel(spotlight_id)
+            if not isinstance(channel, discord.TextChannel):
+                return
+            self._spotlight_channels[cache_key] = channel
         
         ping = f"<@{user.id}>"
-        thumb = random.choice(SPOTLIGHT_STYLE1_THUMBS)
-        desc = random.choice(SPOTLIGHT_PRESTIGE_LINES).format(user=ping)
+        thumb = SPOTLIGHT_STYLE1_THUMBS[_RNG.randrange(len(SPOTLIGHT_STYLE1_THUMBS))]
+        desc = _PRESTIGE_LINES_SANITIZED[_RNG.randrange(len(_PRESTIGE_LINES_SANITIZED))].format(user=ping)
         
-        embed = discord.Embed(
-            description=sanitize_isla_text(desc),
-            color=discord.Color.from_rgb(190, 40, 40)
-        )
+        embed = discord.Embed(description=desc, color=_PRESTIGE_COLOR)
         embed.set_author(name="Isla", icon_url="https://i.imgur.com/5nsuuCV.png")
         embed.set_thumbnail(url=thumb)
         
-        await channel.send(content=ping, embed=embed)
+        try:
+            await channel.send(content=ping, embed=embed)
+        except discord.NotFound:
+            # Channel was deleted; drop the cached handle so the next post re-resolves it
+            self._spotlight_channels.pop(cache_key, None)
+            raise
+    
+    async def _announce_prestige(self, guild: discord.Guild | None, gid: int, uid: int, ts: int):
+        """Record the one-time prestige announcement flag and post it to spotlight."""
+        row_announced = await self.bot.db.fetchone(
+            "SELECT value FROM achievements WHERE guild_id=? AND user_id=? AND key='prestige_announced'",
+            (gid, uid)
+        )
+        if row_announced:
+            return
+        await self.bot.db.execute(
+            "INSERT INTO achievements(guild_id,user_id,key,value,updated_ts) VALUES(?,?,?,?,?)",
+            (gid, uid, "prestige_announced", 1, ts)
+        )
+        member = guild.get_member(uid) if guild else None
+        if member:
+            await self._post_spotlight_prestige(guild, member)
+    
+    def _cache_coins(self, gid: int, uid: int, coins: int):
+        cached = self._stats_cache.get((gid, uid))
+        if cached is not None:
+            self._stats_cache[(gid, uid)] = (coins, *cached[1:])
+    
+    async def _persist_round(
+        self, gid: int, uid: int, wager: int,
+        win_streak: int, loss_streak: int, net: int, ts: int
+    ):
+        """Write a finished round's net coins, weekly wager and streak state in one transaction (runs in the background)."""
+        try:
+            async with self.bot.db.transaction():
+                await self.bot.db.execute(_SQL_ADD_COINS, (net, gid, uid))
+                await self._add_weekly_wager(gid, uid, wager)
+                await self._set_casino_state(gid, uid, win_streak, loss_streak, net, ts=ts)
+        except BaseException:
+            # Nothing was written, so the balance _cache_coins already applied is wrong
+            self._stats_cache.pop((gid, uid), None)
+            raise
     
-    async def _set_coins(self, gid: int, uid: int, coins: int):
-        await self.bot.db.execute("UPDATE users SET coins=? WHERE guild_id=? AND user_id=?", (coins, gid, uid))
+    def _round_write_done(self, key: tuple[int, int], task: asyncio.Task):
+        if self._round_writes.get(key) is task:
+            del self._round_writes[key]
     
     async def _touch_weekly(self, gid: int, uid: int):
         wk = week_key_uk()
-        await self.bot.db.execute(
-            "INSERT OR IGNORE INTO weekly_stats(guild_id,week_key,user_id) VALUES(?,?,?)",
-            (gid, wk, uid)
-        )
+        await self.bot.db.execute(_SQL_TOUCH_WEEKLY, (gid, wk, uid))
     
     async def _add_weekly_wager(self, gid: int, uid: int, wager: int):
         wk = week_key_uk()
         await self._touch_weekly(gid, uid)
-        await self.bot.db.execute(
-            "UPDATE weekly_stats SET casino_wagered = casino_wagered + ? WHERE guild_id=? AND week_key=? AND user_id=?",
-            (int(wager), gid, wk, uid)
-        )
+        await self.bot.db.execute(_SQL_ADD_WEEKLY_WAGER, (int(wager), gid, wk, uid))
     
     async def _casino_state(self, gid: int, uid: int) -> dict:
-        await self.bot.db.execute(
-            "INSERT OR IGNORE INTO casino_user_state(guild_id,user_id,win_streak,loss_streak,last_net,last_play_ts) VALUES(?,?,?,?,?,?)",
-            (gid, uid, 0, 0, 0, 0)
-        )
-        row = await self.bot.db.fetchone(
-            "SELECT win_streak, loss_streak, last_net, last_play_ts FROM casino_user_state WHERE guild_id=? AND user_id=?",
-            (gid, uid)
-        )
+        # Single UPSERT ... RETURNING: yields the row whether it was just created or already existed
+        row = await self.bot.db.execute_fetchone(_SQL_CASINO_STATE, (gid, uid))
         return {
             "win_streak": int(row["win_streak"]),
             "loss_streak": int(row["loss_streak"]),
@@ -625,42 +1017,27 @@ class CasinoCore(commands.Cog):
             "last_play_ts": int(row["last_play_ts"])
         }
     
-    async def _set_casino_state(self, gid: int, uid: int, win_streak: int, loss_streak: int, last_net: int):
+    async def _set_casino_state(self, gid: int, uid: int, win_streak: int, loss_streak: int, last_net: int, ts: int | None = None):
         await self.bot.db.execute(
-            "UPDATE casino_user_state SET win_streak=?, loss_streak=?, last_net=?, last_play_ts=? WHERE guild_id=? AND user_id=?",
-            (int(win_streak), int(loss_streak), int(last_net), now_ts(), gid, uid)
+            _SQL_SET_CASINO_STATE,
+            (int(win_streak), int(loss_streak), int(last_net), now_ts() if ts is None else ts, gid, uid)
         )
     
     def _line(self, key: str, stage: int, filter_all_in: bool = False) -> str:
-        if not key or key not in LINES:
-            return "..."
-        stage = clamp_int(stage, 0, 4)
-        if key in ("casino_win_streak", "casino_loss_streak_break", "dice_high_win", "dice_low_loss",
-                   "slots_small_win", "slots_big_win", "slots_no_win"):
-            stage = max(2, stage)
-        pool = LINES[key].get(stage) or LINES[key].get(2) or ["..."]
-        if filter_all_in and key == "casino_bet_confirm" and stage == 4:
-            pool = [line for line in pool if "I love when you go all in for me" not in line]
-        return random.choice(pool)
+        stage = 0 if stage < 0 else 4 if stage > 4 else stage
+        pool, n = (
+            (filter_all_in and _FILTERED_POOLS.get((key, stage)))
+            or _POOLS.get((key, stage), _FALLBACK_POOL)
+        )
+        return pool[_RNG.randrange(n)]
     
     def _line_fmt(self, key: str, stage: int, **kwargs) -> str:
-        stage = clamp_int(stage, 0, 4)
-        if key in ("casino_win_streak", "casino_loss_streak_break", "dice_high_win", "dice_low_loss",
-                   "slots_small_win", "slots_big_win", "slots_no_win"):
-            stage = max(2, stage)
-        pool = LINES.get(key, {}).get(stage) or LINES.get(key, {}).get(2) or ["..."]
-        s = random.choice(pool)
-        for k, v in kwargs.items():
-            s = s.replace("{" + k + "}", str(v))
-        return s
+        stage = 0 if stage < 0 else 4 if stage > 4 else stage
+        pool, n = _POOLS.get((key, stage), _FALLBACK_POOL)
+        return pool[_RNG.randrange(n)].format_map(_FmtArgs(kwargs))
     
     def _invite_key_for_game(self, game: str) -> str | None:
-        return {
-            "blackjack": "casino_invite_blackjack",
-            "dice": "casino_invite_dice",
-            "roulette": "casino_invite_roulette",
-            "slots": "casino_invite_slots",
-        }.get(game)
+        return _INVITE_KEYS.get(game)
     
     async def _log_round_internal(self, gid: int, uid: int, game: str, wager: int, payout: int, meta: dict):
         """Internal method to log rounds (replaces get_cog call)."""
@@ -680,29 +1057,25 @@ class CasinoCore(commands.Cog):
         gid = interaction.guild_id
         uid = interaction.user.id
         meta = meta or {}
+        ts = now_ts()
+        
+        # Read balance and streaks only after this user's previous round has been written
+        prev_write = self._round_writes.get((gid, uid))
+        if prev_write is not None:
+            await asyncio.wait({prev_write})
         
         coins, obedience, lce, _xp = await self._get_user_stats(gid, uid)
         stage = stage_from_stats(obedience, lce)
         
         net = int(payout) - int(wager)
-        is_all_in = (wager >= coins * 0.99)
+        is_all_in = (wager * 100 >= coins * 99)
         is_extremely_big = (wager >= 50000)
         
         new_bal = coins + net
         if new_bal < 0:
             new_bal = 0
-        
-        await self._set_coins(gid, uid, new_bal)
-        await self._add_weekly_wager(gid, uid, wager)
-        await self._log_round_internal(gid, uid, game, wager, payout, meta)
-        
-        # Forward to Data cog for event tracking
-        tracker = self.bot.get_cog("Data")
-        if tracker:
-            try:
-                await tracker.add_casino_activity(gid, uid, wager, net)
-            except Exception:
-                pass
+        # Update the cached balance now; the DB write follows in _persist_round
+        self._cache_coins(gid, uid, new_bal)
         
         # Streak state
         st = await self._casino_state(gid, uid)
@@ -723,14 +1096,16 @@ class CasinoCore(commands.Cog):
             win_streak = 0
             loss_streak += 1
         
-        await self._set_casino_state(gid, uid, win_streak, loss_streak, net)
+        write = self._spawn_write(self._persist_round(gid, uid, wager, win_streak, loss_streak, net, ts))
+        self._round_writes[(gid, uid)] = write
+        write.add_done_callback(functools.partial(self._round_write_done, (gid, uid)))
         
         # Result line selection
         if payout >= wager * 10 and wager >= 200:
             result_line = self._line("casino_jackpot", stage)
-        elif net > 0 and big_win(wager, net):
+        elif net > 0 and net >= max(2000, wager * 3):
             result_line = self._line("casino_big_win", stage)
-        elif net <= 0 and big_loss(wager, net):
+        elif net <= 0 and -net >= max(2000, wager * 5 // 2):
             result_line = self._line("casino_big_loss", stage)
         elif near_miss_flag(game, meta):
             result_line = self._line("casino_near_miss", stage)
@@ -743,95 +1118,84 @@ class CasinoCore(commands.Cog):
         invite_key = self._invite_key_for_game(game)
         invite_line = self._line(invite_key, stage) if invite_key else None
         
-        # Compose message
-        lines = [f"{interaction.user.mention}"]
-        if invite_line:
-            lines.append(invite_line)
-        if meta.get("allin"):
-            lines.append(self._line("allin_confirm", stage))
+        # Optional message segments (empty string = omitted)
+        is_allin_round = bool(meta.get("allin"))
+        allin_confirm_line = self._line("allin_confirm", stage) if is_allin_round else ""
         filter_all_in_msg = (stage == 4 and not (is_all_in or is_extremely_big))
         bet_confirm_line = self._line("casino_bet_confirm", stage, filter_all_in=filter_all_in_msg)
-        lines.append(bet_confirm_line)
-        if extra_lines:
-            lines.extend(extra_lines)
-        lines.append(result_line)
-        
-        if streak_line:
-            lines.append(streak_line)
-        if streak_break_line:
-            lines.append(streak_break_line)
-        
-        if meta.get("allin"):
-            if net > 0:
-                lines.append(self._line("allin_win", stage))
-            else:
-                lines.append(self._line("allin_loss", stage))
+        allin_outcome_line = ""
+        if is_allin_round:
+            allin_outcome_line = self._line("allin_win" if net > 0 else "allin_loss", stage)
         
         # All-in unlock tracking
-        if meta.get("allin"):
-            await self._bump_achievement(gid, uid, "casino_allin_plays", 1)
+        unlock_lines: list[str] = []
+        announce_prestige = False
+        if is_allin_round:
+            await self._bump_achievement(gid, uid, "casino_allin_plays", 1, ts=ts)
             if net > 0:
-                wins = await self._bump_achievement(gid, uid, "casino_allin_wins", 1)
+                wins = await self._bump_achievement(gid, uid, "casino_allin_wins", 1, ts=ts)
                 if wins == 3:
-                    await self._grant_item(gid, uid, "badge_allin_mark")
-                    lines.append("Unlocked: **Badge All-In Mark**")
+                    await self._grant_item(gid, uid, "badge_allin_mark", ts=ts)
+                    unlock_lines.append("Unlocked: **Badge All-In Mark**")
                 if wins == 10:
-                    await self._grant_item(gid, uid, "collar_allin_obsidian")
-                    lines.append("Unlocked: **All-In Collar Obsidian**")
-                    row_announced = await self.bot.db.fetchone(
-                        "SELECT value FROM achievements WHERE guild_id=? AND user_id=? AND key='prestige_announced'",
-                        (gid, uid)
-                    )
-                    if not row_announced:
-                        await self.bot.db.execute(
-                            "INSERT INTO achievements(guild_id,user_id,key,value,updated_ts) VALUES(?,?,?,?,?)",
-                            (gid, uid, "prestige_announced", 1, now_ts())
-                        )
-                        try:
-                            member = interaction.guild.get_member(uid) if interaction.guild else None
-                            if member:
-                                await self._post_spotlight_prestige(interaction.guild, member)
-                        except Exception:
-                            pass
-        
-        # Game-specific outcome lines
+                    await self._grant_item(gid, uid, "collar_allin_obsidian", ts=ts)
+                    unlock_lines.append("Unlocked: **All-In Collar Obsidian**")
+                    announce_prestige = True
+        
+        # Game-specific outcome line
+        game_flavor_line = ""
         if game == "dice":
             if meta.get("dice_high_win"):
-                lines.append(self._line("dice_high_win", stage))
-            if meta.get("dice_low_loss"):
-                lines.append(self._line("dice_low_loss", stage))
-        
-        if game == "slots":
+                game_flavor_line = self._line("dice_high_win", stage)
+            elif meta.get("dice_low_loss"):
+                game_flavor_line = self._line("dice_low_loss", stage)
+        elif game == "slots":
             if meta.get("slots_big_win_flag"):
-                lines.append(self._line("slots_big_win", stage))
+                game_flavor_line = self._line("slots_big_win", stage)
             elif meta.get("slots_small_win_flag"):
-                lines.append(self._line("slots_small_win", stage))
+                game_flavor_line = self._line("slots_small_win", stage)
             elif meta.get("slots_no_win_flag"):
-                lines.append(self._line("slots_no_win", stage))
-        
-        if game == "blackjack":
+                game_flavor_line = self._line("slots_no_win", stage)
+        elif game == "blackjack":
             if meta.get("bj_blackjack"):
-                lines.append(self._line("blackjack_blackjack_win", stage))
-            if meta.get("bj_bust"):
-                lines.append(self._line("blackjack_bust", stage))
-        
-        lines.append(f"Wager: **{fmt(wager)} Coins**")
-        lines.append(f"Payout: **{fmt(payout)} Coins**")
-        lines.append(f"Balance: **{fmt(new_bal)} Coins**")
-        lines.append(play_again)
-        lines.append("᲼᲼")
-        
-        await interaction.followup.send(embed=casino_embed("\n".join(lines), self.icon))
-        
-        # Big win DM (call internal method instead of get_cog)
-        try:
-            await self.maybe_dm_bigwin(interaction.guild, uid, game, wager, payout, net, meta)
-        except Exception:
-            pass
+                game_flavor_line = self._line("blackjack_blackjack_win", stage)
+            elif meta.get("bj_bust"):
+                game_flavor_line = self._line("blackjack_bust", stage)
+        
+        # Compose message in a single join
+        body = "\n".join(s for s in (
+            interaction.user.mention,
+            invite_line,
+            allin_confirm_line,
+            bet_confirm_line,
+            *(extra_lines or ()),
+            result_line,
+            streak_line,
+            streak_break_line,
+            allin_outcome_line,
+            *unlock_lines,
+            game_flavor_line,
+            f"Wager: **{fmt(wager)} Coins**",
+            f"Payout: **{fmt(payout)} Coins**",
+            f"Balance: **{fmt(new_bal)} Coins**",
+            play_again,
+            "᲼᲼",
+        ) if s)
+        
+        # Send the result alongside the non-critical side effects (round log, Data cog tracking,
+        # big win DM, prestige spotlight)
+        send_task = asyncio.create_task(interaction.followup.send(embed=casino_embed(body, self.icon)))
+        side_effects = [self._log_round_internal(gid, uid, game, wager, payout, meta)]
+        tracker = self.bot.get_cog("Data")
+        if tracker:
+            side_effects.append(tracker.add_casino_activity(gid, uid, wager, net))
+        side_effects.append(self.maybe_dm_bigwin(interaction.guild, uid, game, wager, payout, net, meta))
+        if announce_prestige:
+            side_effects.append(self._announce_prestige(interaction.guild, gid, uid, ts))
+        results = await asyncio.gather(send_task, *side_effects, return_exceptions=True)
+        _log_failures(results, f"Casino {game} round result/side effect failed")
     
     async def _validate_wager(self, interaction: discord.Interaction, wager: int) -> tuple[bool, str]:
-        if not interaction.guild_id:
-            return False, "Use this in a server."
         if wager <= 0:
             return False, "Wager must be > 0."
         coins, *_ = await self._get_user_stats(interaction.guild_id, interaction.user.id)
@@ -844,11 +1208,8 @@ class CasinoCore(commands.Cog):
     # =========================================================
     
     @app_commands.command(name="casino", description="Show casino status and available games.")
+    @guild_defer()
     async def casino(self, interaction: discord.Interaction):
-        if not interaction.guild_id:
-            embed = create_embed("Use this in a server.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
         gid = interaction.guild_id
         uid = interaction.user.id
         await self._ensure_user(gid, uid)
@@ -856,58 +1217,34 @@ class CasinoCore(commands.Cog):
         coins, obedience, lce, _xp = await self._get_user_stats(gid, uid)
         stage = stage_from_stats(obedience, lce)
         
-        desc = "\n".join([
-            f"{interaction.user.mention}",
-            self._line("casino_invite", stage),
-            "",
-            "**Games**",
-            "• `/coinflip` • `/dice` • `/roulette` • `/slots` • `/crash` • `/blackjack`",
-            "",
-            f"Balance: **{fmt(coins)} Coins**",
-            "᲼᲼"
-        ])
-        await interaction.response.send_message(embed=casino_embed(desc, self.icon))
+        desc = _CASINO_DESC_TEMPLATE.format_map({
+            "mention": interaction.user.mention,
+            "invite": self._line("casino_invite", stage),
+            "coins": fmt(coins),
+        })
+        await interaction.followup.send(embed=casino_embed(desc, self.icon))
     
     @app_commands.command(name="coinflip", description="Flip a coin. Heads or tails.")
     @app_commands.describe(wager="Coins to wager", pick="heads or tails")
+    @guild_defer(check=_check_coinflip)
     async def coinflip(self, interaction: discord.Interaction, wager: int, pick: str):
-        ok, msg = await self._validate_wager(interaction, wager)
-        if not ok:
-            return await interaction.response.send_message(msg, ephemeral=True)
-        
         pick = pick.lower().strip()
-        if pick not in ("heads", "tails"):
-            embed = create_embed("Pick must be heads or tails.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        await interaction.response.defer()
         
-        result = random.choice(["heads", "tails"])
+        result = self._rng.choice(["heads", "tails"])
         win = (result == pick)
-        payout = int(wager * 1.95) if win else 0
+        payout = wager * _COINFLIP_PAYOUT_BP // _BP if win else 0
         
         extra = [f"Flip: **{result}**"]
         await self._finish_round(interaction, "coinflip", wager, payout, meta={"pick": pick, "result": result}, extra_lines=extra)
     
     @app_commands.command(name="dice", description="Roll 1–6. Win if you roll above a threshold.")
     @app_commands.describe(wager="Coins to wager", target="Win if roll >= target (2–6)")
+    @guild_defer(check=_check_dice)
     async def dice(self, interaction: discord.Interaction, wager: int, target: int):
-        ok, msg = await self._validate_wager(interaction, wager)
-        if not ok:
-            return await interaction.response.send_message(msg, ephemeral=True)
-        if target < 2 or target > 6:
-            embed = create_embed("Target must be 2–6.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        await interaction.response.defer()
-        
-        roll = random.randint(1, 6)
+        roll = self._rng.randint(1, 6)
         win = roll >= target
         
-        p = (7 - target) / 6.0
-        fair_mult = 1.0 / p
-        mult = fair_mult * 0.94
-        payout = int(wager * mult) if win else 0
+        payout = wager * _DICE_BP[target] // _BP if win else 0
         
         meta = {"roll": roll, "target": target}
         if win and roll >= 5:
@@ -917,115 +1254,53 @@ class CasinoCore(commands.Cog):
         
         extra = [
             self._line_fmt("dice_roll", 2, result=roll),
-            f"Target: **{target}+**"
+            "Target: **%d+**" % target
         ]
         await self._finish_round(interaction, "dice", wager, payout, meta=meta, extra_lines=extra)
     
     @app_commands.command(name="roulette", description="Bet on red/black/green/odd/even or a number (0–36).")
     @app_commands.describe(wager="Coins to wager", bet_type="red|black|green|odd|even|number", number="Only if bet_type=number (0–36)")
+    @guild_defer(check=_check_roulette)
     async def roulette(self, interaction: discord.Interaction, wager: int, bet_type: str, number: int | None = None):
-        ok, msg = await self._validate_wager(interaction, wager)
-        if not ok:
-            return await interaction.response.send_message(msg, ephemeral=True)
-        
         bet_type = bet_type.lower().strip()
-        if bet_type not in ("red", "black", "green", "odd", "even", "number"):
-            embed = create_embed("Invalid bet_type.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        if bet_type == "number":
-            if number is None or number < 0 or number > 36:
-                embed = create_embed("Number must be 0–36.", color="info", is_dm=False, is_system=False)
-                return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        await interaction.response.defer()
-        
-        reds = {1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36}
-        spin = random.randint(0, 36)
-        color = "green" if spin == 0 else ("red" if spin in reds else "black")
-        
-        win = False
-        payout = 0
-        near_miss = False
+        spin = self._rng.randint(0, 36)
+        color = "green" if spin == 0 else ("red" if spin in _ROULETTE_REDS else "black")
         
-        if bet_type in ("red", "black", "green"):
-            win = (color == bet_type)
-            if win:
-                payout = int(wager * (33 if bet_type == "green" else 1.9))
-            else:
-                if color == "green" and bet_type in ("red", "black"):
-                    near_miss = True
-        elif bet_type in ("odd", "even"):
-            if spin != 0:
-                win = ((spin % 2 == 0) and bet_type == "even") or ((spin % 2 == 1) and bet_type == "odd")
-            if win:
-                payout = int(wager * 1.9)
-            else:
-                if spin == 0:
-                    near_miss = True
-        elif bet_type == "number":
-            win = (spin == number)
-            if win:
-                payout = int(wager * 33)
-            else:
-                if spin != 0 and number != 0 and abs(spin - number) == 1:
-                    near_miss = True
+        payout, win, near_miss = _ROULETTE_HANDLERS[bet_type](wager, spin, color, number, bet_type)
         
         extra = [
             self._line("roulette_spin", 2),
             self._line_fmt("roulette_land", 2, color=color, number=spin),
-            f"Bet: **{bet_type}**" + (f" **{number}**" if bet_type == "number" else "")
+            ("Bet: **%s** **%d**" % (bet_type, number) if bet_type == "number" else "Bet: **%s**" % bet_type)
         ]
         await self._finish_round(interaction, "roulette", wager, payout, meta={"spin": spin, "color": color, "bet_type": bet_type, "number": number, "near_miss": near_miss}, extra_lines=extra)
     
     @app_commands.command(name="slots", description="Spin slots.")
     @app_commands.describe(wager="Coins to wager")
+    @guild_defer(check=_check_wager)
     async def slots(self, interaction: discord.Interaction, wager: int):
-        ok, msg = await self._validate_wager(interaction, wager)
-        if not ok:
-            return await interaction.response.send_message(msg, ephemeral=True)
-        
-        await interaction.response.defer()
-        
-        symbols = [("🍒", 35), ("🍋", 30), ("🍇", 18), ("🔔", 10), ("💎", 6), ("👑", 1)]
-        
-        def pick_symbol():
-            total = sum(w for _, w in symbols)
-            r = random.randint(1, total)
-            acc = 0
-            for sym, w in symbols:
-                acc += w
-                if r <= acc:
-                    return sym
-            return "🍒"
-        
-        reel = [pick_symbol(), pick_symbol(), pick_symbol()]
-        a, b, c = reel
+        rng = self._rng
+        spin = rng.choices(_SLOTS_IDX, cum_weights=_SLOTS_CUM, k=3)
+        a, b, c = spin
+        reel = [_SLOTS_GLYPH[a], _SLOTS_GLYPH[b], _SLOTS_GLYPH[c]]
+        # One bit per symbol on the reel: 1 distinct = three of a kind, 2 = a pair
+        mask = (1 << a) | (1 << b) | (1 << c)
+        distinct = mask.bit_count()
+        three = distinct == 1
         
         payout = 0
-        near_miss = False
-        jackpot = False
-        
-        if a == b == c:
-            if a == "👑":
-                jackpot = True
-                payout = int(wager * 20)
-            elif a == "💎":
-                payout = int(wager * 8)
-            elif a == "🔔":
-                payout = int(wager * 5)
-            elif a == "🍇":
-                payout = int(wager * 3)
-            else:
-                payout = int(wager * 2)
-        else:
-            if a == b or b == c or a == c:
-                near_miss = True
-            if "🍒" in reel and random.random() < 0.20:
-                payout = int(wager * 0.35)
+        near_miss = distinct == 2
+        jackpot = three and a == _SLOTS_CROWN
         
-        extra = [self._line("slots_spin", 2), f"Spin: **{a} {b} {c}**"]
+        if three:
+            payout = wager * _SLOTS_TIER[a]
+        elif mask & _SLOTS_CHERRY_BIT and rng.random() < 0.20:
+            payout = wager * _SLOTS_CHERRY_BP // _BP
+        
+        extra = [self._line("slots_spin", 2), f"Spin: **{reel[0]} {reel[1]} {reel[2]}**"]
         meta = {"reel": reel, "near_miss": near_miss, "jackpot": jackpot}
-        if a == b == c or payout >= int(wager * 3):
+        if three or payout >= wager * 3:
             meta["slots_big_win_flag"] = True
         elif payout > 0:
             meta["slots_small_win_flag"] = True
@@ -1036,94 +1311,37 @@ class CasinoCore(commands.Cog):
     
     @app_commands.command(name="crash", description="Pick a cashout multiplier. If the crash happens after it, you win.")
     @app_commands.describe(wager="Coins to wager", target="Cashout multiplier (1.10–10.00)")
+    @guild_defer(check=_check_crash)
     async def crash(self, interaction: discord.Interaction, wager: int, target: float):
-        ok, msg = await self._validate_wager(interaction, wager)
-        if not ok:
-            return await interaction.response.send_message(msg, ephemeral=True)
-        
-        if target < 1.10 or target > 10.00:
-            embed = create_embed("Target must be 1.10–10.00.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        await interaction.response.defer()
-        
-        u = random.random()
-        crash_point = max(1.0, 0.96 / max(0.0001, u))
-        crash_point = min(crash_point, 25.0)
+        # Play on the 2dp target that is shown and paid, not the raw float
+        target_c = round(target * 100)
+        target = target_c / 100
+        u = self._rng.random() or 1e-300
+        crash_point = 0.96 / u
+        if crash_point < 1.0:
+            crash_point = 1.0
+        elif crash_point > 25.0:
+            crash_point = 25.0
         
         win = crash_point >= target
-        payout = int(wager * target * 0.98) if win else 0
+        payout = wager * target_c * _CRASH_EDGE_BP // (100 * _BP) if win else 0
         near_miss = (not win) and (crash_point >= target * 0.92)
         
-        extra = [f"Target: **{target:.2f}x**", f"Crash: **{crash_point:.2f}x**"]
+        extra = ["Target: **%.2fx**" % target, "Crash: **%.2fx**" % crash_point]
         await self._finish_round(interaction, "crash", wager, payout, meta={"target": target, "crash_point": crash_point, "near_miss": near_miss}, extra_lines=extra)
     
     @app_commands.command(name="blackjack", description="Blackjack (lite). You draw 2, dealer draws 2. Auto rules.")
     @app_commands.describe(wager="Coins to wager")
+    @guild_defer(check=_check_wager)
     async def blackjack(self, interaction: discord.Interaction, wager: int):
-        ok, msg = await self._validate_wager(interaction, wager)
-        if not ok:
-            return await interaction.response.send_message(msg, ephemeral=True)
-        
-        await interaction.response.defer()
-        
-        ranks = ["A","2","3","4","5","6","7","8","9","10","J","Q","K"]
-        values = {"A": 11, "J": 10, "Q": 10, "K": 10}
-        for i in range(2, 11):
-            values[str(i)] = i
-        
-        def draw():
-            r = random.choice(ranks)
-            return r, values[r]
-        
-        def hand_value(cards):
-            total = sum(v for _, v in cards)
-            aces = sum(1 for r, _ in cards if r == "A")
-            while total > 21 and aces > 0:
-                total -= 10
-                aces -= 1
-            return total
-        
-        player = [draw(), draw()]
-        dealer = [draw(), draw()]
-        
-        while hand_value(dealer) < 17:
-            dealer.append(draw())
-        
-        pv = hand_value(player)
-        dv = hand_value(dealer)
-        
-        payout = 0
-        outcome = "push"
-        near_miss = False
-        
-        if pv == 21 and len(player) == 2 and not (dv == 21 and len(dealer) == 2):
-            payout = int(wager * 2.35)
-            outcome = "blackjack"
-        elif pv > 21:
-            payout = 0
-            outcome = "bust"
-        elif dv > 21:
-            payout = int(wager * 1.95)
-            outcome = "dealer_bust"
-        else:
-            if pv > dv:
-                payout = int(wager * 1.95)
-                outcome = "win"
-            elif pv < dv:
-                payout = 0
-                outcome = "loss"
-            else:
-                payout = wager
-                outcome = "push"
+        player, dealer, pv, dv = _deal_blackjack(self._rng)
         
-        if outcome in ("loss", "bust") and pv >= 19:
-            near_miss = True
+        payout, outcome, near_miss = _resolve_blackjack(wager, pv, dv, len(player), len(dealer))
         
         def fmt_hand(cards):
-            return " ".join(r for r, _ in cards)
+            return " ".join(cards)
         
-        upcard = dealer[0][0]
+        upcard = dealer[0]
         extra = [
             self._line_fmt("blackjack_deal", 2, card=upcard),
             f"Your hand: **{fmt_hand(player)}** (**{pv}**)",
@@ -1141,90 +1359,48 @@ class CasinoCore(commands.Cog):
     # Helper methods for /allin
     async def _play_dice(self, interaction: discord.Interaction, wager: int, target: int, meta: dict | None = None):
         meta = meta or {}
-        roll = random.randint(1, 6)
+        roll = self._rng.randint(1, 6)
         win = roll >= target
-        p = (7 - target) / 6.0
-        fair_mult = 1.0 / p
-        mult = fair_mult * 0.94
-        payout = int(wager * mult) if win else 0
+        payout = wager * _DICE_BP[target] // _BP if win else 0
         meta.update({"roll": roll, "target": target})
         if win and roll >= 5:
             meta["dice_high_win"] = True
         if (not win) and roll <= 2:
             meta["dice_low_loss"] = True
-        extra = [self._line_fmt("dice_roll", 2, result=roll), f"Target: **{target}+**"]
+        extra = [self._line_fmt("dice_roll", 2, result=roll), "Target: **%d+**" % target]
         await self._finish_round(interaction, "dice", wager, payout, meta=meta, extra_lines=extra)
     
     async def _play_roulette(self, interaction: discord.Interaction, wager: int, bet_type: str, number: int | None, meta: dict | None = None):
         meta = meta or {}
         bet_type = bet_type.lower().strip()
-        reds = {1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36}
-        spin = random.randint(0, 36)
-        color = "green" if spin == 0 else ("red" if spin in reds else "black")
-        win = False
-        payout = 0
-        near_miss = False
-        
-        if bet_type in ("red", "black", "green"):
-            win = (color == bet_type)
-            if win:
-                payout = int(wager * (33 if bet_type == "green" else 1.9))
-            else:
-                if color == "green" and bet_type in ("red", "black"):
-                    near_miss = True
-        elif bet_type in ("odd", "even"):
-            if spin != 0:
-                win = ((spin % 2 == 0) and bet_type == "even") or ((spin % 2 == 1) and bet_type == "odd")
-            if win:
-                payout = int(wager * 1.9)
-            else:
-                if spin == 0:
-                    near_miss = True
-        elif bet_type == "number":
-            win = (spin == number)
-            if win:
-                payout = int(wager * 33)
-            else:
-                if spin != 0 and number != 0 and abs(spin - number) == 1:
-                    near_miss = True
+        spin = self._rng.randint(0, 36)
+        color = "green" if spin == 0 else ("red" if spin in _ROULETTE_REDS else "black")
+        payout, win, near_miss = _ROULETTE_HANDLERS[bet_type](wager, spin, color, number, bet_type)
         
-        extra = [self._line("roulette_spin", 2), self._line_fmt("roulette_land", 2, color=color, number=spin), f"Bet: **{bet_type}**" + (f" **{number}**" if bet_type == "number" else "")]
+        extra = [self._line("roulette_spin", 2), self._line_fmt("roulette_land", 2, color=color, number=spin), ("Bet: **%s** **%d**" % (bet_type, number) if bet_type == "number" else "Bet: **%s**" % bet_type)]
         meta.update({"spin": spin, "color": color, "bet_type": bet_type, "number": number, "near_miss": near_miss})
         await self._finish_round(interaction, "roulette", wager, payout, meta=meta, extra_lines=extra)
     
     async def _play_slots(self, interaction: discord.Interaction, wager: int, meta: dict | None = None):
         meta = meta or {}
-        symbols = [("🍒", 35), ("🍋", 30), ("🍇", 18), ("🔔", 10), ("💎", 6), ("👑", 1)]
-        
-        def pick_symbol():
-            total = sum(w for _, w in symbols)
-            r = random.randint(1, total)
-            acc = 0
-            for sym, w in symbols:
-                acc += w
-                if r <= acc:
-                    return sym
-            return symbols[0][0]
-        
-        reel = [pick_symbol(), pick_symbol(), pick_symbol()]
-        a, b, c = reel
-        jackpot = (a == b == c == "👑")
-        three_match = (a == b == c) and not jackpot
+        spin = self._rng.choices(_SLOTS_IDX, cum_weights=_SLOTS_CUM, k=3)
+        a, b, c = spin
+        reel = [_SLOTS_GLYPH[a], _SLOTS_GLYPH[b], _SLOTS_GLYPH[c]]
+        distinct = ((1 << a) | (1 << b) | (1 << c)).bit_count()
+        three = distinct == 1
+        jackpot = three and a == _SLOTS_CROWN
         payout = 0
         near_miss = False
         
-        if jackpot:
-            payout = int(wager * 100)
-        elif three_match:
-            tier = {"🍒": 3, "🍋": 5, "🍇": 10, "🔔": 20, "💎": 50}.get(a, 3)
-            payout = int(wager * tier)
-        elif (a == b) or (b == c) or (a == c):
-            payout = int(wager * 1.5)
+        if three:
+            payout = wager * _ALLIN_SLOTS_TIER[a]
+        elif distinct == 2:
+            payout = wager * _ALLIN_SLOTS_PAIR_BP // _BP
             near_miss = True
         
-        extra = [f"**{a} {b} {c}**"]
+        extra = [f"**{reel[0]} {reel[1]} {reel[2]}**"]
         meta.update({"reel": reel, "near_miss": near_miss, "jackpot": jackpot})
-        if a == b == c or payout >= int(wager * 3):
+        if three or payout >= wager * 3:
             meta["slots_big_win_flag"] = True
         elif payout > 0:
             meta["slots_small_win_flag"] = True
@@ -1234,61 +1410,13 @@ class CasinoCore(commands.Cog):
     
     async def _play_blackjack(self, interaction: discord.Interaction, wager: int, meta: dict | None = None):
         meta = meta or {}
-        ranks = ["A","2","3","4","5","6","7","8","9","10","J","Q","K"]
-        values = {"A": 11, "J": 10, "Q": 10, "K": 10}
-        for i in range(2, 11):
-            values[str(i)] = i
-        
-        def draw():
-            r = random.choice(ranks)
-            return r, values[r]
-        
-        def hand_value(cards):
-            total = sum(v for _, v in cards)
-            aces = sum(1 for r, _ in cards if r == "A")
-            while total > 21 and aces > 0:
-                total -= 10
-                aces -= 1
-            return total
-        
-        player = [draw(), draw()]
-        dealer = [draw(), draw()]
-        while hand_value(dealer) < 17:
-            dealer.append(draw())
-        
-        pv = hand_value(player)
-        dv = hand_value(dealer)
-        payout = 0
-        outcome = "push"
-        near_miss = False
-        
-        if pv == 21 and len(player) == 2 and not (dv == 21 and len(dealer) == 2):
-            payout = int(wager * 2.35)
-            outcome = "blackjack"
-        elif pv > 21:
-            payout = 0
-            outcome = "bust"
-        elif dv > 21:
-            payout = int(wager * 1.95)
-            outcome = "dealer_bust"
-        else:
-            if pv > dv:
-                payout = int(wager * 1.95)
-                outcome = "win"
-            elif pv < dv:
-                payout = 0
-                outcome = "loss"
-            else:
-                payout = wager
-                outcome = "push"
-        
-        if outcome in ("loss", "bust") and pv >= 19:
-            near_miss = True
+        player, dealer, pv, dv = _deal_blackjack(self._rng)
+        payout, outcome, near_miss = _resolve_blackjack(wager, pv, dv, len(player), len(dealer))
         
         def fmt_hand(cards):
-            return " ".join(r for r, _ in cards)
+            return " ".join(cards)
         
-        upcard = dealer[0][0]
+        upcard = dealer[0]
         extra = [self._line_fmt("blackjack_deal", 2, card=upcard), f"Your hand: **{fmt_hand(player)}** (**{pv}**)", f"Dealer: **{fmt_hand(dealer)}** (**{dv}**)"]
         meta.update({"pv": pv, "dv": dv, "outcome": outcome, "near_miss": near_miss, "upcard": upcard})
         if outcome == "blackjack":
@@ -1305,27 +1433,37 @@ class CasinoCore(commands.Cog):
         app_commands.Choice(name="slots", value="slots"),
         app_commands.Choice(name="blackjack", value="blackjack"),
     ])
+    @guild_defer()
     async def allin(self, interaction: discord.Interaction, game: str):
-        if not interaction.guild_id:
-            embed = create_embed("Use this in a server.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        await interaction.response.defer()
         gid = interaction.guild_id
         uid = interaction.user.id
         
-        row = await self.bot.db.fetchone("SELECT last_allin_ts FROM users WHERE guild_id=? AND user_id=?", (gid, uid))
-        if row:
-            last_allin_ts = int(row.get("last_allin_ts") or 0)
-            if now_ts() - last_allin_ts < 120:
+        ts = now_ts()
+        key = (gid, uid)
+        last = self._allin_last.get(key)
+        if last is not None:
+            if ts - last < _ALLIN_COOLDOWN:
                 return await interaction.followup.send("You need a moment before going all-in again.", ephemeral=True)
-        
-        bal = await self._get_balance(gid, uid)
-        if bal <= 0:
-            embed = create_embed("You have nothing to wager.", color="info", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
-        
-        await self.bot.db.execute("UPDATE users SET last_allin_ts=? WHERE guild_id=? AND user_id=?", (now_ts(), gid, uid))
+            del self._allin_last[key]
+        # Claim the cooldown and read the balance in one statement; no row back means the user
+        # is missing, still on cooldown, or broke
+        claim = (ts, gid, uid, ts - _ALLIN_COOLDOWN)
+        row = await self.bot.db.execute_fetchone(_SQL_ALLIN_CLAIM, claim)
+        if row is None:
+            await self._ensure_user(gid, uid)
+            state = await self.bot.db.fetchone(_SQL_ALLIN_STATE, (gid, uid))
+            if ts - int(state[1] or 0) < _ALLIN_COOLDOWN:
+                return await interaction.followup.send("You need a moment before going all-in again.", ephemeral=True)
+            if int(state[0] or 0) <= 0:
+                embed = create_embed("You have nothing to wager.", color="info", is_dm=False, is_system=False)
+                return await interaction.followup.send(embed=embed, ephemeral=True)
+            row = await self.bot.db.execute_fetchone(_SQL_ALLIN_CLAIM, claim)
+            if row is None:
+                return await interaction.followup.send("You need a moment before going all-in again.", ephemeral=True)
+        bal = int(row[0])
+        self._allin_last[key] = ts
+        if len(self._allin_last) > _ALLIN_SWEEP_AT:
+            self._allin_last = {k: t for k, t in self._allin_last.items() if ts - t < _ALLIN_COOLDOWN}
         
         game = game.lower().strip()
         meta = {"allin": True}
@@ -1343,20 +1481,21 @@ class CasinoCore(commands.Cog):
             return await interaction.followup.send(embed=embed, ephemeral=True)
     
     @app_commands.command(name="allin_progress", description="Check your All-In unlock progress.")
+    @guild_defer(ephemeral=True)
     async def allin_progress(self, interaction: discord.Interaction):
-        if not interaction.guild_id:
-            embed = create_embed("Use this in a server.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
         gid = interaction.guild_id
         uid = interaction.user.id
         
-        row_plays = await self.bot.db.fetchone("SELECT value FROM achievements WHERE guild_id=? AND user_id=? AND key='casino_allin_plays'", (gid, uid))
-        row_wins = await self.bot.db.fetchone("SELECT value FROM achievements WHERE guild_id=? AND user_id=? AND key='casino_allin_wins'", (gid, uid))
-        plays = int(row_plays["value"]) if row_plays else 0
-        wins = int(row_wins["value"]) if row_wins else 0
+        rows = await self.bot.db.fetchall(
+            "SELECT key, value FROM achievements WHERE guild_id=? AND user_id=? AND key IN ('casino_allin_plays','casino_allin_wins')",
+            (gid, uid)
+        )
+        progress = {r["key"]: int(r["value"]) for r in rows}
+        plays = progress.get("casino_allin_plays", 0)
+        wins = progress.get("casino_allin_wins", 0)
         
         desc = f"{interaction.user.mention}\nAll-In plays: **{fmt(plays)}**\nAll-In wins: **{fmt(wins)}**\n\nUnlocks\n• 3 wins: `badge_allin_mark`\n• 10 wins: `collar_allin_obsidian`\n᲼᲼"
-        await interaction.response.send_message(embed=casino_embed(desc, self.icon), ephemeral=True)
+        await interaction.followup.send(embed=casino_embed(desc, self.icon), ephemeral=True)
     
     # =========================================================
     # BIGWIN DM METHODS (from casino_bigwin_dm.py)
@@ -1519,13 +1658,14 @@ class CasinoCore(commands.Cog):
         new_best_net = best_net
         new_best_payout = best_payout
         new_best_ts = best_ts
+        ts = now_ts()
         
         if net > best_net:
             new_best_net = net
-            new_best_ts = now_ts()
+            new_best_ts = ts
         if payout > best_payout:
             new_best_payout = payout
-            new_best_ts = now_ts()
+            new_best_ts = ts
         
         new_count = state["bigwins_count"] + 1
         is_allin = meta.get("allin", False)
@@ -1536,7 +1676,7 @@ class CasinoCore(commands.Cog):
         except Exception:
             return
         
-        await self._set_bigwin_state(gid, uid, best_net=new_best_net, best_payout=new_best_payout, best_ts=new_best_ts, last_dm_day_key=today, last_dm_ts=now_ts(), bigwins_count=new_count)
+        await self._set_bigwin_state(gid, uid, best_net=new_best_net, best_payout=new_best_payout, best_ts=new_best_ts, last_dm_day_key=today, last_dm_ts=ts, bigwins_count=new_count)
     
     # =========================================================
     # ROYALTY METHODS (from casino_royalty.py)
@@ -1551,34 +1691,65 @@ class CasinoCore(commands.Cog):
         except Exception:
             return None
     
-    async def _clear_roles(self, guild: discord.Guild, roles: list[discord.Role]):
-        role_ids = {r.id for r in roles if r}
-        for member in guild.members:
-            if member.bot:
-                continue
-            to_remove = [r for r in member.roles if r.id in role_ids]
-            if to_remove:
+    async def _set_royalty_roles(self, member: discord.Member, role_ids: set[int], keep: discord.Role | None, reason: str):
+        """Drop every royalty role except `keep` (added if missing) with one API call per member."""
+        current = member.roles
+        to_remove = [r for r in current if r.id in role_ids and r != keep]
+        needs_add = keep is not None and keep not in current
+        if len(to_remove) + needs_add > 1:
+            # Several role changes: one Modify Guild Member PATCH instead of a request per role
+            new_roles = [r for r in current if not r.is_default() and r not in to_remove]
+            if needs_add:
+                new_roles.append(keep)
+            await member.edit(roles=new_roles, reason=reason)
+        elif to_remove:
+            await member.remove_roles(*to_remove, reason=reason)
+        elif needs_add:
+            await member.add_roles(keep, reason=reason)
+    
+    async def _edit_members(self, jobs: list[tuple[discord.Member, set[int], discord.Role | None, str]]):
+        async def run(member, role_ids, keep, reason):
+            async with self._sem:
                 try:
-                    await member.remove_roles(*to_remove, reason="IslaBot: rotating casino royalty")
+                    await self._set_royalty_roles(member, role_ids, keep, reason)
                 except Exception:
                     pass
+        
+        await asyncio.gather(*(run(*job) for job in jobs))
     
-    async def _top3_by_wager(self, guild_id: int, week_key: str):
-        rows = await self.bot.db.fetchall("SELECT user_id, casino_wagered FROM weekly_stats WHERE guild_id=? AND week_key=? ORDER BY casino_wagered DESC LIMIT 3", (guild_id, week_key))
-        return [(int(r["user_id"]), int(r["casino_wagered"])) for r in rows if int(r["casino_wagered"]) > 0]
+    async def _clear_roles(self, guild: discord.Guild, roles: list[discord.Role], skip=()):
+        role_ids = {r.id for r in roles if r}
+        # Only current holders need touching; Role.members comes straight from the member cache
+        holders = {m for r in roles if r for m in r.members}
+        jobs = [
+            (member, role_ids, None, "IslaBot: rotating casino royalty")
+            for member in holders
+            if not member.bot and member.id not in skip
+        ]
+        await self._edit_members(jobs)
     
-    async def _dm_winner(self, guild: discord.Guild, user_id: int, place: int, wagered: int):
+    async def _top3_with_highlights(self, guild_id: int, week_key: str, since_ts: int):
+        """Top 3 wagerers for the week plus each one's recent highlight (uid -> dict)."""
+        rows = await self.bot.db.fetchall(
+            "SELECT user_id, casino_wagered FROM weekly_stats "
+            "WHERE guild_id=? AND week_key=? AND casino_wagered > 0 "
+            "ORDER BY casino_wagered DESC LIMIT 3",
+            (guild_id, week_key)
+        )
+        top3 = [(int(r[0]), int(r[1])) for r in rows]
+        if not top3:
+            return top3, {}
+        try:
+            highlights = await self.get_recent_highlights(guild_id, [uid for uid, _ in top3], since_ts)
+        except Exception:
+            highlights = {}
+        return top3, highlights
+    
+    async def _dm_winner(self, guild: discord.Guild, user_id: int, place: int, wagered: int, highlight: dict | None = None):
         member = guild.get_member(user_id)
         if not member:
             return
         
-        since_ts = now_ts() - 7 * 24 * 3600
-        highlight = None
-        try:
-            highlight = await self.get_recent_user_highlight(guild.id, user_id, since_ts)
-        except Exception:
-            highlight = None
-        
         remembered = ""
         if highlight:
             if highlight.get("net", 0) > 0:
@@ -1594,7 +1765,7 @@ class CasinoCore(commands.Cog):
             text = f"{member.mention}\n{remembered}**#3**.\nTotal wagered: **{fmt(wagered)} Coins**.\nYou made it. Barely. Don't slow down.\n᲼᲼"
         
         try:
-            await member.send(embed=create_embed(description=sanitize_isla_text(text), color="casino", thumbnail=CASINO_THUMBS[int(now_ts()) % len(CASINO_THUMBS)], is_dm=True, is_system=False))
+            await member.send(embed=create_embed(description=sanitize_isla_text(text), color="casino", thumbnail=CASINO_THUMBS[now_ts() % _CASINO_THUMBS_LEN], is_dm=True, is_system=False))
         except Exception:
             pass
     
@@ -1604,54 +1775,97 @@ class CasinoCore(commands.Cog):
         if not isinstance(ch, discord.TextChannel):
             return
         
-        pings = " ".join([f"||<@{uid}>||" for uid, _ in top3])
-        lines = [f"Weekly Casino Royalty ({week_key})\n"]
+        ping_parts = []
+        lines = [f"{_RNG.choice(_SPOTLIGHT_FLAVOR)}\n\nWeekly Casino Royalty ({week_key})\n"]
         for i, (uid, wagered) in enumerate(top3, start=1):
+            ping_parts.append(f"||<@{uid}>||")
             lines.append(f"**#{i}** <@{uid}> — **{fmt(wagered)} Coins wagered**")
+        lines.append(f"\n{_RNG.choice(_SPOTLIGHT_CLOSER)}\n᲼᲼")
         
-        flavor = ["I checked the tables.", "I looked at the casino logs.", "I peeked at who couldn't resist."]
-        closer = ["Try to catch them.", "If you want my attention, you know what to do.", "Next week I expect better."]
+        desc = "\n".join(lines)
+        pings = " ".join(ping_parts)
         
-        desc = f"{random.choice(flavor)}\n\n" + "\n".join(lines) + f"\n\n{random.choice(closer)}\n᲼᲼"
-        
-        embed = create_embed(description=sanitize_isla_text(desc), color="casino", thumbnail=CASINO_THUMBS[int(now_ts()) % len(CASINO_THUMBS)], is_dm=False, is_system=True)
+        embed = create_embed(description=sanitize_isla_text(desc), color="casino", thumbnail=CASINO_THUMBS[now_ts() % _CASINO_THUMBS_LEN], is_dm=False, is_system=True)
         await ch.send(content=pings, embed=embed)
     
-    @tasks.loop(time=time(hour=12, minute=10, tzinfo=UK_TZ))
+    @tasks.loop()
     async def weekly_awards(self):
         await self.bot.wait_until_ready()
-        
-        if now_local().weekday() != 0:
-            return
-        
-        week_key = prev_week_key_uk()
-        
-        for guild in self.bot.guilds:
-            try:
-                top3 = await self._top3_by_wager(guild.id, week_key)
-                if not top3:
-                    continue
-                
-                roles = []
-                for name in ROLE_NAMES:
-                    roles.append(await self._get_or_create_role(guild, name))
-                
-                await self._clear_roles(guild, roles)
-                
-                for idx, (uid, wagered) in enumerate(top3):
-                    role = roles[idx] if idx < len(roles) else None
-                    member = guild.get_member(uid)
-                    if member and role:
-                        try:
-                            await member.add_roles(role, reason="IslaBot: weekly casino royalty")
-                        except Exception:
-                            pass
-                    await self._dm_winner(guild, uid, idx + 1, wagered)
-                
-                await self._spotlight_post(guild, week_key, top3)
-                
-            except Exception:
-                continue
+        try:
+            slot = awards_slot_uk(now_local())
+            row = await self.bot.db.fetchone("SELECT v FROM kv_store WHERE k=?", (_AWARDS_KV_KEY,))
+            if row is None:
+                # No marker yet (first start after deploy): the previous build's loop already awarded
+                # the latest slot, so record it as done instead of awarding it again
+                await self._set_awards_marker(awards_week_key(slot))
+                last_awarded = awards_week_key(slot)
+            else:
+                last_awarded = row["v"]
+            # Slots since the last awarded week, newest first
+            due = []
+            for n in range(_AWARDS_CATCHUP_WEEKS):
+                past = slot - timedelta(days=7 * n)
+                if awards_week_key(past) == last_awarded:
+                    break
+                due.append(past)
+            for past in reversed(due):
+                await self._award_week(past)
+            await discord.utils.sleep_until(slot + timedelta(days=7))
+        except Exception as e:
+            print(f"ERROR: Weekly casino awards failed: {e}")
+            await asyncio.sleep(_AWARDS_RETRY.total_seconds())
+
+    async def _award_week(self, slot: datetime):
+        """Award one week's royalty in every guild, then record it as done."""
+        week_key = awards_week_key(slot)
+        # Highlights window: the 7 days up to the start of the slot's Monday
+        week_end = slot.replace(hour=0, minute=0)
+        since_ts = int(week_end.timestamp()) - 7 * 24 * 3600
+        results = await asyncio.gather(
+            *(self._process_guild_awards(guild, week_key, since_ts) for guild in self.bot.guilds),
+            return_exceptions=True
+        )
+        _log_failures(results, "Weekly casino awards failed for a guild")
+        await self._set_awards_marker(week_key)
+    
+    async def _set_awards_marker(self, week_key: str):
+        await self.bot.db.execute(
+            "INSERT INTO kv_store(k,v) VALUES(?,?) ON CONFLICT(k) DO UPDATE SET v=excluded.v",
+            (_AWARDS_KV_KEY, week_key)
+        )
+
+    async def _process_guild_awards(self, guild: discord.Guild, week_key: str, since_ts: int):
+        try:
+            top3, highlights = await self._top3_with_highlights(guild.id, week_key, since_ts)
+            if not top3:
+                return
+            
+            roles = []
+            for name in ROLE_NAMES:
+                roles.append(await self._get_or_create_role(guild, name))
+            
+            # Winners get their old tier swapped for the new one in the same edit
+            winners = {uid: roles[idx] for idx, (uid, _) in enumerate(top3) if idx < len(roles) and roles[idx]}
+            await self._clear_roles(guild, roles, skip=winners)
+            
+            role_ids = {r.id for r in roles if r}
+            jobs = []
+            for uid, role in winners.items():
+                member = guild.get_member(uid)
+                if member:
+                    jobs.append((member, role_ids, role, "IslaBot: weekly casino royalty"))
+            await self._edit_members(jobs)
+            
+            results = await asyncio.gather(
+                *(self._dm_winner(guild, uid, idx + 1, wagered, highlights.get(uid)) for idx, (uid, wagered) in enumerate(top3)),
+                return_exceptions=True
+            )
+            _log_failures(results, f"Weekly casino winner DM failed in guild {guild.id}")
+            
+            await self._spotlight_post(guild, week_key, top3)
+            
+        except Exception as e:
+            print(f"ERROR: Weekly casino awards failed in guild {guild.id}: {e}")
 
 
 async def setup(bot: commands.Bot):
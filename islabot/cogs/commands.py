@@ -1,21 +1,25 @@
 from __future__ import annotations
+import asyncio
 import time
+from collections import defaultdict
+from collections.abc import Mapping
+from types import MappingProxyType
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 
 from core.utility import now_ts, day_key
 from utils.embed_utils import create_embed
 from utils.info_embed import info_embed
 from utils.isla_style import isla_embed, fmt
-from utils.guild_config import cfg_get
-from utils.economy import ensure_wallet, get_wallet, add_coins
+from utils.guild_config import cfg_get, on_cfg_set
+from utils.economy import get_wallet, transfer_coins
 
 # ============================================================================
 # INFO TOPICS (from info_unified.py)
 # ============================================================================
 
-INFO_TOPICS: dict[str, dict] = {
+_INFO_TOPICS: dict[str, dict] = {
     "islabot": {
         "title": "IslaBot",
         "desc": (
@@ -191,6 +195,11 @@ INFO_TOPICS: dict[str, dict] = {
     },
 }
 
+INFO_TOPICS: Mapping[str, Mapping] = MappingProxyType({k: MappingProxyType(v) for k, v in _INFO_TOPICS.items()})
+
+# Topics are static, so their embeds are built once; discord.py serializes them per send without mutating
+INFO_EMBEDS: dict[str, discord.Embed] = {k: info_embed(v["title"], v["desc"]) for k, v in INFO_TOPICS.items()}
+
 TOPIC_CHOICES = [
     app_commands.Choice(name="IslaBot Overview", value="islabot"),
     app_commands.Choice(name="Casino (Overview)", value="casino"),
@@ -209,90 +218,126 @@ TOPIC_CHOICES = [
 # PUBLIC COMMAND CATEGORIES (from core_commands.py)
 # ============================================================================
 
-PUBLIC_CATEGORIES: dict[str, dict] = {
+_PUBLIC_CATEGORIES: dict[str, dict] = {
     "start": {
         "title": "Getting Started",
         "blurb": "New here? Start clean. Opt in only what you want.",
-        "items": [
+        "items": (
             ("/about", "What Isla is, and how the system works."),
             ("/verify", "Mark yourself verified + consent-ready (server roles permitting)."),
             ("/consent view", "See what you're opted into."),
             ("/consent optin module:<...>", "Opt into modules you want."),
             ("/safeword", "Pause Isla for you instantly."),
-        ],
+        ),
     },
     "economy": {
         "title": "Coins & Economy",
         "blurb": "Coins are access. Attention is earned, not free.",
-        "items": [
+        "items": (
             ("/balance", "See your Coins and Debt."),
             ("/daily", "Claim your daily Coins."),
             ("/burn amount:<n>", "Burn Coins for symbolic attention."),
-        ],
+        ),
     },
     "orders": {
         "title": "Orders & Obedience",
         "blurb": "Obedience is optional. Opt in first. Earn the tone.",
-        "items": [
+        "items": (
             ("/orders", "Receive an order (opt-in required)."),
             ("/orders_complete proof:<text>", "Complete your active order."),
             ("/orders_refuse reason:<text>", "Refuse your active order (debt may apply)."),
-        ],
+        ),
     },
     "shop": {
         "title": "Shop & Cosmetics",
         "blurb": "Status is bought. Collars are chosen.",
-        "items": [
+        "items": (
             ("/shop", "Browse items available right now."),
             ("/buy item_key:<key>", "Buy an item."),
             ("/inventory", "View what you own."),
             ("/equipped", "See what you're currently wearing."),
             ("/equip item_key:<key>", "Equip a collar/role you own."),
             ("/unequip", "Remove your equipped collar/role."),
-        ],
+        ),
     },
     "spotlight": {
         "title": "Spotlight",
         "blurb": "Visible effort. Quiet power. Earn your place.",
-        "items": [
+        "items": (
             ("/spotlight", "Today's spotlight leaderboard."),
-        ],
+        ),
     },
     "profile": {
         "title": "Profile",
         "blurb": "Your standing—measured, remembered, and (only) what you consent to.",
-        "items": [
+        "items": (
             ("/profile", "View your profile."),
-        ],
+        ),
     },
     "events": {
         "title": "Seasonal Events",
         "blurb": "Limited windows. Different rules. Better rewards.",
-        "items": [
+        "items": (
             ("/event", "See the currently active seasonal event."),
-        ],
+        ),
     },
     "privacy": {
         "title": "Privacy",
         "blurb": "You control your participation. Always.",
-        "items": [
+        "items": (
             ("/resetme", "Reset your Isla stats (coins/consent/orders)."),
             ("/optout", "Hard leave: delete your progress + stop tracking (if enabled on this server)."),
             ("/optin", "Re-join after opting out (if enabled on this server)."),
-        ],
+        ),
     },
     "core": {
         "title": "Core",
         "blurb": "Housekeeping. Clarity. Control.",
-        "items": [
+        "items": (
             ("/commands", "Show command categories or commands in a category."),
             ("/ping", "Latency + uptime."),
             ("/status", "What's active right now (public-safe)."),
-        ],
+        ),
     },
 }
 
-PUBLIC_MODULES = [
+# Read-only views: the embeds below are prebuilt from these, so they must not change at runtime
+PUBLIC_CATEGORIES: Mapping[str, Mapping] = MappingProxyType({k: MappingProxyType(v) for k, v in _PUBLIC_CATEGORIES.items()})
+
+# /commands output is static for the process lifetime, so both views are built once.
+# utils.isla_style.isla_embed takes the body first; titles always go by keyword
+_CATEGORY_LIST_EMBED = isla_embed(
+    "\n\n".join(f"**{v['title']}** — `{k}`\n{v['blurb']}" for k, v in PUBLIC_CATEGORIES.items())
+    + "\n\nUse `/commands category:<name>` to see commands in a category.",
+    title="Command Categories",
+)
+
+_CATEGORY_EMBEDS: dict[str, discord.Embed] = {
+    k: isla_embed(
+        "\n".join([f"**{v['title']}**\n{v['blurb']}\n"] + [f"• **{cmd}** — {desc}" for cmd, desc in v["items"]]),
+        title=v["title"],
+    )
+    for k, v in PUBLIC_CATEGORIES.items()
+}
+
+def _normalize_category(cat: str) -> str:
+    return (cat or "").strip().lower().replace(" ", "_")
+
+# Command name (e.g. "balance" for "/balance") -> category key; lets /commands accept a command as well
+_CMD_INDEX: dict[str, str] = {
+    cmd.lstrip("/").split(" ", 1)[0].lower(): k
+    for k, v in PUBLIC_CATEGORIES.items()
+    for cmd, _ in v["items"]
+}
+
+# Every accepted /commands input, pre-normalized -> category embed: command names, titles ("getting_started"), keys
+_CATEGORY_LOOKUP: dict[str, discord.Embed] = {
+    **{name: _CATEGORY_EMBEDS[k] for name, k in _CMD_INDEX.items()},
+    **{_normalize_category(v["title"]): _CATEGORY_EMBEDS[k] for k, v in PUBLIC_CATEGORIES.items()},
+    **_CATEGORY_EMBEDS,
+}
+
+PUBLIC_MODULES: tuple[tuple[str, str], ...] = (
     ("economy", "Coins & Economy"),
     ("orders", "Orders"),
     ("shop", "Shop"),
@@ -300,26 +345,91 @@ PUBLIC_MODULES = [
     ("leaderboard", "Spotlight"),
     ("events", "Seasonal Events"),
     ("profile", "Profile"),
-]
+)
+
+# Context-menu lines, picked by user id so the same target gets the same line
+_PRAISE_LINES: tuple[str, ...] = (
+    "Good work.",
+    "I noticed your consistency.",
+    "You handled that well.",
+    "Reliable.",
+    "Keep that up.",
+)
+
+_HUMILIATE_LINES: tuple[str, ...] = (
+    "That wasn't your best.",
+    "You can do better than that.",
+    "Disappointing effort.",
+    "Sloppy. Fix it.",
+    "Not impressed.",
+)
+
+# %-templates for the per-call response bodies (mention, line) / (latency, shard, uptime) / (mode, event, modules)
+_CONTEXT_LINE_TEMPLATE = "%s\n\n%s\n᲼᲼"
+_PING_TEMPLATE = "Latency: **%dms**\nShard: **%s**\nUptime: **%s**"
+_STATUS_TEMPLATE = "Config mode: **%s**\nActive event: **%s**\n\n**Modules (this channel):**\n%s"
+
+_ABOUT_EMBED = isla_embed(
+    "**Isla** is a consent-based, coin-driven roleplay utility.\n\n"
+    "**How it works:**\n"
+    "• **Coins** are your access key. More Coins unlock warmer tone and more options.\n"
+    "• **Obedience** is *optional* and requires opt-in. If you don't opt in, Isla stays neutral.\n"
+    "• **Burn** is symbolic—spend Coins to signal attention-seeking.\n"
+    "• **Consent controls everything.** You can opt into modules, pause with **/safeword**, or reset.\n\n"
+    "If you want the soft version: earn Coins.\n"
+    "If you want the stricter version: opt in—and prove consistency.",
+    title="About Isla",
+)
+
+# Responses that never vary, built once and reused
+_SAVED_NOTE_EMBED = isla_embed("Saved.\n᲼᲼", title="Note")
+_TIP_INVALID_EMBED = isla_embed("Invalid amount.\n᲼᲼", title="Coin Tip")
+_TIP_NOT_POSITIVE_EMBED = isla_embed("Amount must be positive.\n᲼᲼", title="Coin Tip")
+_TIP_INSUFFICIENT_EMBED = isla_embed("You don't have enough Coins.\n᲼᲼", title="Coin Tip")
+_TIP_REFUSED_EMBED = isla_embed("No.\n᲼᲼", title="Coin Tip")
+_NOT_FOR_YOU_PRAISE = isla_embed("Not for you.\n᲼᲼", title="Praise")
+_NOT_FOR_YOU_HUMILIATE = isla_embed("Not for you.\n᲼᲼", title="Humiliate")
+_NOT_FOR_YOU_ADD_NOTE = isla_embed("Not for you.\n᲼᲼", title="Add Note")
+_NO_CONSENT_HUMILIATE = isla_embed("That user hasn't consented to this.\n᲼᲼", title="Humiliate")
+
+# Events start and end on the order of hours; /status can show a label up to this old
+_EVENT_CACHE_TTL = 60
 
 # ============================================================================
 # CONTEXT MENU HELPERS (from context_apps.py)
 # ============================================================================
 
+# manage_messages | moderate_members | administrator, as one permission bit mask
+_MOD_MASK = discord.Permissions(manage_messages=True, moderate_members=True, administrator=True).value
+
 def is_mod(member: discord.Member) -> bool:
-    p = member.guild_permissions
-    return p.manage_messages or p.moderate_members or p.administrator
+    return bool(member.guild_permissions.value & _MOD_MASK)
+
+# guild_id -> (parsed roles.consent id or 0, expiry_ts)
+_CONSENT_ROLE_CACHE: dict[int, tuple[int, int]] = {}
+_CONSENT_ROLE_TTL = 300
+
+@on_cfg_set
+def _drop_consent_role(guild_id: int, key: str):
+    if key == "roles.consent":
+        _CONSENT_ROLE_CACHE.pop(guild_id, None)
 
 async def has_consent(bot, guild_id: int, member: discord.Member) -> bool:
     """Consent role check (config: roles.consent)"""
-    role_id = await cfg_get(bot.db, guild_id, "roles.consent", "")
-    if not role_id:
-        return False
-    try:
-        rid = int(role_id)
-    except ValueError:
+    ts = now_ts()
+    cached = _CONSENT_ROLE_CACHE.get(guild_id)
+    if cached and cached[1] > ts:
+        rid = cached[0]
+    else:
+        role_id = await cfg_get(bot.db, guild_id, "roles.consent", "")
+        try:
+            rid = int(role_id) if role_id else 0
+        except ValueError:
+            rid = 0
+        _CONSENT_ROLE_CACHE[guild_id] = (rid, ts + _CONSENT_ROLE_TTL)
+    if not rid:
         return False
-    return any(r.id == rid for r in member.roles)
+    return member.get_role(rid) is not None
 
 async def log_action(bot, guild: discord.Guild, title: str, desc: str):
     logs_id = await cfg_get(bot.db, guild.id, "channels.logs", "")
@@ -349,13 +459,12 @@ class AddNoteModal(discord.ui.Modal, title="Add Staff Note"):
         self.target = target
 
     async def on_submit(self, interaction: discord.Interaction):
-        from utils.uk_parse import now_ts as now_ts_util
         await self.bot.db.execute(
             """
             INSERT INTO user_notes(guild_id,user_id,note,added_by,ts)
             VALUES(?,?,?,?,?)
             """,
-            (interaction.guild_id, self.target.id, self.note.value, interaction.user.id, now_ts_util())
+            (interaction.guild_id, self.target.id, self.note.value, interaction.user.id, now_ts())
         )
 
         await log_action(
@@ -366,7 +475,7 @@ class AddNoteModal(discord.ui.Modal, title="Add Staff Note"):
         )
 
         await interaction.response.send_message(
-            embed=isla_embed("Saved.\n᲼᲼", title="Note"),
+            embed=_SAVED_NOTE_EMBED,
             ephemeral=True
         )
 
@@ -384,29 +493,25 @@ class CoinTipModal(discord.ui.Modal, title="Coin Tip"):
             amt = int(self.amount.value)
         except ValueError:
             return await interaction.response.send_message(
-                embed=isla_embed("Invalid amount.\n᲼᲼", title="Coin Tip"),
+                embed=_TIP_INVALID_EMBED,
                 ephemeral=True
             )
 
         if amt <= 0:
             return await interaction.response.send_message(
-                embed=isla_embed("Amount must be positive.\n᲼᲼", title="Coin Tip"),
+                embed=_TIP_NOT_POSITIVE_EMBED,
                 ephemeral=True
             )
 
         gid = interaction.guild_id
-        await ensure_wallet(self.bot.db, gid, interaction.user.id)
-        await ensure_wallet(self.bot.db, gid, self.target.id)
-
         w = await get_wallet(self.bot.db, gid, interaction.user.id)
         if w.coins < amt:
             return await interaction.response.send_message(
-                embed=isla_embed("You don't have enough Coins.\n᲼᲼", title="Coin Tip"),
+                embed=_TIP_INSUFFICIENT_EMBED,
                 ephemeral=True
             )
 
-        await add_coins(self.bot.db, gid, interaction.user.id, -amt, kind="tip", reason=self.reason.value, other_user_id=self.target.id)
-        await add_coins(self.bot.db, gid, self.target.id, amt, kind="tip", reason=self.reason.value, other_user_id=interaction.user.id)
+        await transfer_coins(self.bot.db, gid, interaction.user.id, self.target.id, amt, reason=self.reason.value, kind_out="tip", kind_in="tip")
 
         await interaction.response.send_message(
             embed=isla_embed(
@@ -425,6 +530,28 @@ class Commands(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Optional bot services, resolved once (IslaBot sets them before cogs load)
+        self._personality = getattr(bot, "personality", None)
+        self._flags = getattr(bot, "flags", None)
+        self._chan_cfg = getattr(bot, "chan_cfg", None)
+        # guild_id -> (/status active-event label, expiry_ts)
+        self._event_cache: dict[int, tuple[str, int]] = {}
+        # Per-message activity, coalesced in memory and written by flush_activity
+        self._activity_buf: defaultdict[tuple[int, int, str], int] = defaultdict(int)  # (guild_id, user_id, day_key) -> messages
+        self._last_msg_buf: dict[tuple[int, int], int] = {}  # (guild_id, user_id) -> last message ts
+        self.flush_activity.start()
+
+    async def cog_unload(self):
+        self.flush_activity.cancel()
+        task = self.flush_activity.get_task()
+        if task is not None:
+            # Let a cancelled in-flight flush roll back and return its batch to the buffers
+            await asyncio.wait({task})
+        # Bot.close unloads cogs before it closes the database, so this write still lands
+        try:
+            await self._flush_activity_buffers()
+        except Exception as e:
+            print(f"ERROR: Failed to flush message activity on unload: {e}")
 
     # ========================================================================
     # ACTIVITY TRACKING (from alive.py)
@@ -436,36 +563,63 @@ class Commands(commands.Cog):
             return
         gid, uid = msg.guild.id, msg.author.id
 
-        # Hard opt-out means: no tracking
-        if await self.bot.db.is_opted_out(gid, uid):
+        # Hard opt-out means: no tracking (answered from memory once the set is loaded)
+        opted_out = self.bot.db.opted_out_cached(gid, uid)
+        if opted_out is None:
+            opted_out = await self.bot.db.is_opted_out(gid, uid)
+        if opted_out:
             return
 
         # Admin-applied safeword means: no tracking
-        u = await self.bot.db.fetchone(
-            "SELECT safeword_until_ts FROM users WHERE guild_id=? AND user_id=?",
-            (gid, uid),
-        )
-        if u and u["safeword_until_ts"] and int(u["safeword_until_ts"]) > now_ts():
+        ts = now_ts()
+        if await self.bot.db.safeword_until(gid, uid) > ts:
             return
 
-        await self.bot.db.ensure_user(gid, uid)
-        await self.bot.db.execute(
-            "UPDATE users SET last_msg_ts=? WHERE guild_id=? AND user_id=?",
-            (now_ts(), gid, uid),
-        )
-
-        dk = day_key()
-        await self.bot.db.execute(
-            """INSERT INTO user_activity_daily(guild_id,user_id,day_key,messages)
-               VALUES(?,?,?,1)
-               ON CONFLICT(guild_id,user_id,day_key) DO UPDATE SET messages=messages+1""",
-            (gid, uid, dk),
-        )
+        self._activity_buf[(gid, uid, day_key(ts))] += 1
+        self._last_msg_buf[(gid, uid)] = ts
 
         # Hot-reload personality if file changed
-        if hasattr(self.bot, "personality"):
-            if self.bot.personality.maybe_reload():
-                self.bot.personality.sanitize()
+        if self._personality is not None and self._personality.maybe_reload():
+            self._personality.sanitize()
+
+    @tasks.loop(seconds=5)
+    async def flush_activity(self):
+        """Write buffered message activity in one transaction."""
+        try:
+            await self._flush_activity_buffers()
+        except Exception as e:
+            print(f"ERROR: Failed to flush message activity: {e}")
+
+    async def _flush_activity_buffers(self):
+        if not self._last_msg_buf:
+            return
+        activity, self._activity_buf = self._activity_buf, defaultdict(int)
+        last_msg, self._last_msg_buf = self._last_msg_buf, {}
+        users = list(last_msg)
+        db = self.bot.db
+        try:
+            async with db.transaction():
+                await db.executemany("INSERT OR IGNORE INTO users(guild_id,user_id) VALUES(?,?)", users)
+                await db.executemany("INSERT OR IGNORE INTO consent(guild_id,user_id) VALUES(?,?)", users)
+                await db.executemany("INSERT OR IGNORE INTO server_state(guild_id) VALUES(?)", [(g,) for g in {g for g, _ in users}])
+                await db.executemany(
+                    "UPDATE users SET last_msg_ts=? WHERE guild_id=? AND user_id=?",
+                    [(ts, gid, uid) for (gid, uid), ts in last_msg.items()],
+                )
+                await db.executemany(
+                    """INSERT INTO user_activity_daily(guild_id,user_id,day_key,messages)
+                       VALUES(?,?,?,?)
+                       ON CONFLICT(guild_id,user_id,day_key) DO UPDATE SET messages=messages+excluded.messages""",
+                    [(gid, uid, dk, n) for (gid, uid, dk), n in activity.items()],
+                )
+        except BaseException:
+            # Rolled back: merge the batch into anything buffered since, for the next flush to retry
+            for k, n in activity.items():
+                self._activity_buf[k] += n
+            for k, ts in last_msg.items():
+                if ts > self._last_msg_buf.get(k, 0):
+                    self._last_msg_buf[k] = ts
+            raise
 
     # ========================================================================
     # CORE COMMANDS (from core_commands.py)
@@ -476,54 +630,25 @@ class Commands(commands.Cog):
     async def commands_cmd(self, interaction: discord.Interaction, category: str | None = None):
         await interaction.response.defer(ephemeral=True)
 
-        def _normalize_category(cat: str) -> str:
-            return (cat or "").strip().lower().replace(" ", "_")
-
         # If no category: show categories list
         if not category:
-            lines = []
-            for k, v in PUBLIC_CATEGORIES.items():
-                lines.append(f"**{v['title']}** — `{k}`\n{v['blurb']}")
-            e = isla_embed(
-                "Command Categories",
-                "\n\n".join(lines) + "\n\nUse `/commands category:<name>` to see commands in a category.",
-            )
-            await interaction.followup.send(embed=e, ephemeral=True)
+            await interaction.followup.send(embed=_CATEGORY_LIST_EMBED, ephemeral=True)
             return
 
-        cat = _normalize_category(category)
-        if cat not in PUBLIC_CATEGORIES:
+        e = _CATEGORY_LOOKUP.get(_normalize_category(category).lstrip("/"))
+        if e is None:
             await interaction.followup.send(
                 "Unknown category. Use `/commands` to see the list.",
                 ephemeral=True,
             )
             return
 
-        block = PUBLIC_CATEGORIES[cat]
-        items = block["items"]
-        lines = [f"**{block['title']}**\n{block['blurb']}\n"]
-        for cmd, desc in items:
-            lines.append(f"• **{cmd}** — {desc}")
-
-        e = isla_embed(block["title"], "\n".join(lines))
         await interaction.followup.send(embed=e, ephemeral=True)
 
     @app_commands.command(name="about", description="Learn what Isla is and how the system works.")
     async def about(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-
-        text = (
-            "**Isla** is a consent-based, coin-driven roleplay utility.\n\n"
-            "**How it works:**\n"
-            "• **Coins** are your access key. More Coins unlock warmer tone and more options.\n"
-            "• **Obedience** is *optional* and requires opt-in. If you don't opt in, Isla stays neutral.\n"
-            "• **Burn** is symbolic—spend Coins to signal attention-seeking.\n"
-            "• **Consent controls everything.** You can opt into modules, pause with **/safeword**, or reset.\n\n"
-            "If you want the soft version: earn Coins.\n"
-            "If you want the stricter version: opt in—and prove consistency."
-        )
-        e = isla_embed("About Isla", text)
-        await interaction.followup.send(embed=e, ephemeral=True)
+        await interaction.followup.send(embed=_ABOUT_EMBED, ephemeral=True)
 
     @app_commands.command(name="ping", description="Bot latency and uptime.")
     async def ping(self, interaction: discord.Interaction):
@@ -544,10 +669,7 @@ class Commands(commands.Cog):
         else:
             uptime_txt = "—"
 
-        e = isla_embed(
-            "Ping",
-            f"Latency: **{latency_ms}ms**\nShard: **{shard_txt}**\nUptime: **{uptime_txt}**",
-        )
+        e = isla_embed(_PING_TEMPLATE % (latency_ms, shard_txt, uptime_txt), title="Ping")
         await interaction.followup.send(embed=e, ephemeral=True)
 
     @app_commands.command(name="status", description="See active modules and event status (public-safe).")
@@ -561,53 +683,49 @@ class Commands(commands.Cog):
         gid = interaction.guild.id
         cid = interaction.channel_id
 
-        # Public module flags (enabled/disabled only)
-        module_lines = []
-        for feature_key, label in PUBLIC_MODULES:
-            enabled = True
-            if hasattr(self.bot, "flags"):
-                enabled = await self.bot.flags.is_enabled(gid, feature_key, channel_id=cid)
-            module_lines.append(f"• {label}: **{'ON' if enabled else 'OFF'}**")
+        # Public module flags (enabled/disabled only); "events" also gates the event line below
+        flags = {}
+        if self._flags is not None:
+            flags = await self._flags.snapshot(gid, [k for k, _ in PUBLIC_MODULES], channel_id=cid)
+        module_lines = [f"• {label}: **{'ON' if flags.get(k, True) else 'OFF'}**" for k, label in PUBLIC_MODULES]
 
         # "Config mode" (keep it generic & non-sensitive)
         mode = "Standard"
-        if hasattr(self.bot, "chan_cfg"):
-            v = await self.bot.chan_cfg.get(gid, cid, "mode", default=None)
+        if self._chan_cfg is not None:
+            v = await self._chan_cfg.get(gid, cid, "mode", default=None)
             if v:
                 safe = v.strip().title()
                 if safe in ("Standard", "Soft", "Strict", "Event"):
                     mode = safe
 
         # Active event (safe)
-        event_txt = "None"
-        if await self._events_enabled(gid, cid):
-            event = await self.bot.db.fetchone(
-                """SELECT event_id, event_type, name, end_ts 
-                   FROM events 
-                   WHERE guild_id=? AND is_active=1 
-                   ORDER BY start_ts DESC LIMIT 1""",
-                (gid,),
-            )
-            if event and event["event_id"]:
-                end_ts = int(event["end_ts"]) if event["end_ts"] else None
-                if end_ts:
-                    event_txt = f"`{event['name']}` (ends <t:{end_ts}:R>)"
-                else:
-                    event_txt = f"`{event['name']}`"
-
-        desc = (
-            f"Config mode: **{mode}**\n"
-            f"Active event: **{event_txt}**\n\n"
-            "**Modules (this channel):**\n" + "\n".join(module_lines)
-        )
+        event_txt = await self._active_event_text(gid) if flags.get("events", True) else "None"
 
-        e = isla_embed("Isla Status", desc)
+        e = isla_embed(_STATUS_TEMPLATE % (mode, event_txt, "\n".join(module_lines)), title="Isla Status")
         await interaction.followup.send(embed=e, ephemeral=True)
 
-    async def _events_enabled(self, gid: int, cid: int) -> bool:
-        if hasattr(self.bot, "flags"):
-            return await self.bot.flags.is_enabled(gid, "events", channel_id=cid)
-        return True
+    async def _active_event_text(self, gid: int) -> str:
+        """Public-safe label for the guild's active event, cached for _EVENT_CACHE_TTL seconds."""
+        ts = now_ts()
+        cached = self._event_cache.get(gid)
+        if cached and cached[1] > ts:
+            return cached[0]
+        event = await self.bot.db.fetchone(
+            """SELECT event_id, event_type, name, end_ts 
+               FROM events 
+               WHERE guild_id=? AND is_active=1 
+               ORDER BY start_ts DESC LIMIT 1""",
+            (gid,),
+        )
+        event_txt = "None"
+        if event and event["event_id"]:
+            end_ts = int(event["end_ts"]) if event["end_ts"] else None
+            if end_ts:
+                event_txt = f"`{event['name']}` (ends <t:{end_ts}:R>)"
+            else:
+                event_txt = f"`{event['name']}`"
+        self._event_cache[gid] = (event_txt, ts + _EVENT_CACHE_TTL)
+        return event_txt
 
     # ========================================================================
     # INFO COMMAND (from info_unified.py)
@@ -615,10 +733,9 @@ class Commands(commands.Cog):
 
     @app_commands.command(name="info", description="Show info about IslaBot features.")
     @app_commands.choices(topic=TOPIC_CHOICES)
-    async def info(self, interaction: discord.Interaction, topic: app_commands.Choice[str]):
-        key = topic.value
-        data = INFO_TOPICS.get(key) or INFO_TOPICS["islabot"]
-        e = info_embed(data["title"], data["desc"])
+    async def info(self, interaction: discord.Interaction, topic: str):
+        # Annotated as str so discord.py hands over the raw value instead of scanning TOPIC_CHOICES for it
+        e = INFO_EMBEDS.get(topic) or INFO_EMBEDS["islabot"]
         await interaction.response.send_message(embed=e, ephemeral=True)
 
     # ========================================================================
@@ -628,23 +745,11 @@ class Commands(commands.Cog):
     async def praise(self, interaction: discord.Interaction, member: discord.Member):
         if not interaction.guild or not isinstance(interaction.user, discord.Member) or not is_mod(interaction.user):
             return await interaction.response.send_message(
-                embed=isla_embed("Not for you.\n᲼᲼", title="Praise"),
+                embed=_NOT_FOR_YOU_PRAISE,
                 ephemeral=True
             )
 
-        lines = [
-            "Good work.",
-            "I noticed your consistency.",
-            "You handled that well.",
-            "Reliable.",
-            "Keep that up."
-        ]
-
-        msg = (
-            f"{member.mention}\n\n"
-            f"{lines[hash(member.id) % len(lines)]}\n"
-            "᲼᲼"
-        )
+        msg = _CONTEXT_LINE_TEMPLATE % (member.mention, _PRAISE_LINES[member.id % len(_PRAISE_LINES)])
 
         await interaction.response.send_message(
             embed=isla_embed(msg, title="Praise"),
@@ -661,32 +766,17 @@ class Commands(commands.Cog):
     async def humiliate(self, interaction: discord.Interaction, member: discord.Member):
         if not interaction.guild or not isinstance(interaction.user, discord.Member) or not is_mod(interaction.user):
             return await interaction.response.send_message(
-                embed=isla_embed("Not for you.\n᲼᲼", title="Humiliate"),
+                embed=_NOT_FOR_YOU_HUMILIATE,
                 ephemeral=True
             )
 
         if not await has_consent(self.bot, interaction.guild_id, member):
             return await interaction.response.send_message(
-                embed=isla_embed(
-                    "That user hasn't consented to this.\n᲼᲼",
-                    title="Humiliate"
-                ),
+                embed=_NO_CONSENT_HUMILIATE,
                 ephemeral=True
             )
 
-        lines = [
-            "That wasn't your best.",
-            "You can do better than that.",
-            "Disappointing effort.",
-            "Sloppy. Fix it.",
-            "Not impressed."
-        ]
-
-        msg = (
-            f"{member.mention}\n\n"
-            f"{lines[hash(interaction.user.id) % len(lines)]}\n"
-            "᲼᲼"
-        )
+        msg = _CONTEXT_LINE_TEMPLATE % (member.mention, _HUMILIATE_LINES[interaction.user.id % len(_HUMILIATE_LINES)])
 
         await interaction.response.send_message(
             embed=isla_embed(msg, title="Correction"),
@@ -703,16 +793,16 @@ class Commands(commands.Cog):
     async def add_note(self, interaction: discord.Interaction, member: discord.Member):
         if not interaction.guild or not isinstance(interaction.user, discord.Member) or not is_mod(interaction.user):
             return await interaction.response.send_message(
-                embed=isla_embed("Not for you.\n᲼᲼", title="Add Note"),
+                embed=_NOT_FOR_YOU_ADD_NOTE,
                 ephemeral=True
             )
 
         await interaction.response.send_modal(AddNoteModal(self.bot, member))
 
     async def coin_tip(self, interaction: discord.Interaction, member: discord.Member):
-        if not interaction.guild or member.bot or member.id == interaction.user.id:
+        if member.bot or member.id == interaction.user.id or not interaction.guild:
             return await interaction.response.send_message(
-                embed=isla_embed("No.\n᲼᲼", title="Coin Tip"),
+                embed=_TIP_REFUSED_EMBED,
                 ephemeral=True
             )
 
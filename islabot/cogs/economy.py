@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import functools
 import json
 import math
 import time
+from datetime import date, datetime
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 
 from core.utility import now_ts, fmt
-from utils.helpers import isla_embed, now_ts as now_ts_helper, ensure_user_row
+from utils.helpers import isla_embed
 from utils.embed_utils import create_embed
-from utils.uk_time import uk_day_ymd, uk_now
-from utils.economy import get_wallet, add_coins, get_recent_ledger, ensure_wallet
+from utils.uk_time import UK_TZ, uk_day_ymd
+from utils.economy import get_wallet, add_coins, get_recent_ledger, ensure_wallet, transfer_coins
 
 ISLA_ICON = "https://i.imgur.com/5nsuuCV.png"
 STYLE1_NEUTRAL = "https://i.imgur.com/9oUjOQQ.png"
@@ -64,18 +66,54 @@ def calculate_tax(coins: int) -> tuple[int, int]:
     new_balance = max(0, coins - coins_taken)
     return (coins_taken, new_balance)
 
-def iso_week_key() -> str:
-    d = uk_now().date()
-    y, w, _ = d.isocalendar()
+@functools.lru_cache(maxsize=16)
+def _iso_week_for_day(day_ymd: str) -> str:
+    y, w, _ = date.fromisoformat(day_ymd).isocalendar()
     return f"{y}-W{w:02d}"
 
+def iso_week_key() -> str:
+    return _iso_week_for_day(uk_day_ymd(now_ts()))
+
+@functools.lru_cache(maxsize=64)
 def uk_midnight_ts(day_ymd: str) -> int:
-    from datetime import datetime
-    from zoneinfo import ZoneInfo
-    UK = ZoneInfo("Europe/London")
-    dt = datetime.fromisoformat(day_ymd + "T00:00:00").replace(tzinfo=UK)
+    dt = datetime.fromisoformat(day_ymd + "T00:00:00").replace(tzinfo=UK_TZ)
     return int(dt.timestamp())
 
+def history_embed(target: discord.abc.User, rows, heading: str, icon: str) -> discord.Embed:
+    lines = []
+    for r in rows:
+        delta = int(r["delta"])
+        kind = str(r["kind"])
+        reason = str(r["reason"] or "")
+        ts = int(r["ts"])
+        sign = "+" if delta >= 0 else ""
+        t = time.strftime("%Y-%m-%d %H:%M", time.gmtime(ts))
+        extra = f" — {reason}" if reason else ""
+        lines.append(f"`{t}` {sign}{delta} ({kind}){extra}")
+
+    e = isla_embed(f"{target.mention}\n᲼᲼", title="History", icon=icon)
+    e.add_field(name=heading, value="\n".join(lines[:25]), inline=False)
+    return e
+
+class HistoryView(discord.ui.View):
+    """Pages /coins history backwards using the ledger's keyset cursor."""
+
+    def __init__(self, bot: commands.Bot, guild_id: int, target: discord.abc.User, limit: int, cursor: tuple[int, int], icon: str):
+        super().__init__(timeout=120)
+        self.bot = bot
+        self.guild_id = guild_id
+        self.target = target
+        self.limit = limit
+        self.cursor = cursor
+        self.icon = icon
+
+    @discord.ui.button(label="Older", style=discord.ButtonStyle.secondary)
+    async def older(self, interaction: discord.Interaction, button: discord.ui.Button):
+        rows, self.cursor = await get_recent_ledger(self.bot.db, self.guild_id, self.target.id, limit=self.limit, before=self.cursor)
+        button.disabled = self.cursor is None
+        e = history_embed(self.target, rows, f"Older {len(rows)}", self.icon)
+        await interaction.response.edit_message(embed=e, view=self)
+
 # ============================================================================
 # MAIN ECONOMY COG CLASS
 # ============================================================================
@@ -91,6 +129,10 @@ class Economy(commands.Cog):
         self.coins = app_commands.Group(name="coins", description="Coins economy")
         self.tax_group = app_commands.Group(name="tax", description="Tax commands", parent=self.coins)
         
+        # (guild_id, user_id) -> (day_ymd, coins sent that UK day); hot cache of the rollup for /coins pay
+        self._sent_today: dict[tuple[int, int], tuple[str, int]] = {}
+        self._sent_day = ""  # UK day the entries above belong to; the dict is cleared when it rolls over
+        
         # Start tax check task
         self.tax_check.start()
         
@@ -205,6 +247,7 @@ class Economy(commands.Cog):
                         "UPDATE users SET coins=? WHERE guild_id=? AND user_id=?",
                         (coins_after, gid, uid)
                     )
+                    self.bot.dispatch("user_stats_changed", gid, uid)
                     try:
                         await self.bot.db.execute(
                             "INSERT INTO coin_ledger(guild_id,user_id,ts,delta,reason) VALUES(?,?,?,?,?)",
@@ -324,43 +367,28 @@ class Economy(commands.Cog):
 
         uid = interaction.user.id
         today = uk_day_ymd(now_ts())
-
-        await self.bot.db.execute(
-            "INSERT OR IGNORE INTO economy_daily(guild_id,user_id,streak,last_claim_ymd) VALUES(?,?,0,'')",
-            (gid, uid)
+        yesterday = date.fromordinal(date.fromisoformat(today).toordinal() - 1).isoformat()
+
+        # Claim and advance the streak in one statement; no row back means already claimed today
+        row = await self.bot.db.execute_fetchone(
+            """
+            INSERT INTO economy_daily(guild_id,user_id,streak,last_claim_ymd) VALUES(?,?,1,?)
+            ON CONFLICT(guild_id,user_id) DO UPDATE SET
+              streak = CASE WHEN last_claim_ymd = ? THEN streak + 1 ELSE 1 END,
+              last_claim_ymd = excluded.last_claim_ymd
+            WHERE last_claim_ymd <> excluded.last_claim_ymd
+            RETURNING streak
+            """,
+            (gid, uid, today, yesterday)
         )
-        row = await self.bot.db.fetchone(
-            "SELECT streak,last_claim_ymd FROM economy_daily WHERE guild_id=? AND user_id=?",
-            (gid, uid)
-        )
-        streak = int(row["streak"] or 0)
-        last = str(row["last_claim_ymd"] or "")
-
-        if last == today:
+        if row is None:
             return await interaction.followup.send(embed=isla_embed("Already claimed today.\n᲼᲼", title="Daily", icon=self.icon), ephemeral=True)
-
-        from datetime import datetime, timedelta
-        from zoneinfo import ZoneInfo
-        UK = ZoneInfo("Europe/London")
-        dt_today = datetime.fromisoformat(today).replace(tzinfo=UK).date()
-        try:
-            dt_last = datetime.fromisoformat(last).replace(tzinfo=UK).date()
-        except Exception:
-            dt_last = None
-
-        if dt_last and dt_last == (dt_today - timedelta(days=1)):
-            streak += 1
-        else:
-            streak = 1
+        streak = int(row[0])
 
         base = 80
         bonus = min(120, (streak - 1) * 10)
         amount = base + bonus
 
-        await self.bot.db.execute(
-            "UPDATE economy_daily SET streak=?, last_claim_ymd=? WHERE guild_id=? AND user_id=?",
-            (streak, today, gid, uid)
-        )
         await add_coins(self.bot.db, gid, uid, amount, kind="daily", reason=f"daily streak {streak}")
 
         e = isla_embed(
@@ -381,44 +409,49 @@ class Economy(commands.Cog):
         uid = interaction.user.id
         wk = iso_week_key()
 
-        await self.bot.db.execute(
-            "INSERT OR IGNORE INTO economy_weekly(guild_id,user_id,last_claim_week) VALUES(?,?, '')",
-            (gid, uid)
-        )
-        row = await self.bot.db.fetchone(
-            "SELECT last_claim_week FROM economy_weekly WHERE guild_id=? AND user_id=?",
-            (gid, uid)
+        row = await self.bot.db.execute_fetchone(
+            """
+            INSERT INTO economy_weekly(guild_id,user_id,last_claim_week) VALUES(?,?,?)
+            ON CONFLICT(guild_id,user_id) DO UPDATE SET last_claim_week = excluded.last_claim_week
+            WHERE last_claim_week <> excluded.last_claim_week
+            RETURNING last_claim_week
+            """,
+            (gid, uid, wk)
         )
-        last = str(row["last_claim_week"] or "")
-        if last == wk:
+        if row is None:
             return await interaction.followup.send(embed=isla_embed("Already claimed this week.\n᲼᲼", title="Weekly", icon=self.icon), ephemeral=True)
 
         cutoff = now_ts() - (7 * 86400)
         r = await self.bot.db.fetchone(
-            "SELECT COALESCE(SUM(ABS(delta)), 0) AS vol FROM economy_ledger WHERE guild_id=? AND user_id=? AND ts >= ?",
-            (gid, uid, cutoff)
+            "SELECT COALESCE(SUM(vol), 0) AS vol FROM economy_vol_hourly WHERE guild_id=? AND user_id=? AND hour >= ?",
+            (gid, uid, cutoff // 3600)
         )
         vol = int(r["vol"] or 0)
         base = 250
         bonus = min(750, vol // 2000)
         amount = base + bonus
 
-        await self.bot.db.execute(
-            "UPDATE economy_weekly SET last_claim_week=? WHERE guild_id=? AND user_id=?",
-            (wk, gid, uid)
-        )
         await add_coins(self.bot.db, gid, uid, amount, kind="weekly", reason=f"weekly bonus {wk}")
 
         e = isla_embed(f"Weekly payout.\n\n+**{fmt(amount)} Coins**\n᲼᲼", title="Weekly", icon=self.icon)
         await interaction.followup.send(embed=e, ephemeral=True)
 
-    async def _sum_sent_today(self, guild_id: int, user_id: int) -> int:
+    async def _sum_sent_today(self, guild_id: int, user_id: int) -> tuple[str, int]:
         day = uk_day_ymd(now_ts())
+        if day != self._sent_day:
+            # UK midnight: every cached total is for a previous day
+            self._sent_today.clear()
+            self._sent_day = day
+        cached = self._sent_today.get((guild_id, user_id))
+        if cached and cached[0] == day:
+            return cached
+        # Cold key or UK midnight rollover: reload from the rollup
         row = await self.bot.db.fetchone(
-            "SELECT COALESCE(SUM(-delta), 0) AS sent FROM economy_ledger WHERE guild_id=? AND user_id=? AND kind='pay_out' AND ts >= ?",
-            (guild_id, user_id, uk_midnight_ts(day))
+            "SELECT COALESCE(SUM(sent), 0) AS sent FROM economy_vol_hourly WHERE guild_id=? AND user_id=? AND hour >= ?",
+            (guild_id, user_id, uk_midnight_ts(day) // 3600)
         )
-        return int(row["sent"] or 0)
+        cached = self._sent_today[(guild_id, user_id)] = (day, int(row["sent"] or 0))
+        return cached
 
     @app_commands.command(name="pay", description="Peer-to-peer transfer (max 500 a day).")
     @app_commands.describe(user="Recipient", amount="Coins to send", reason="Optional note")
@@ -439,7 +472,7 @@ class Economy(commands.Cog):
         if amount <= 0:
             return await interaction.followup.send(embed=isla_embed("Use a real number.\n᲼᲼", title="Pay", icon=self.icon), ephemeral=True)
 
-        sent_today = await self._sum_sent_today(gid, sender.id)
+        day, sent_today = await self._sum_sent_today(gid, sender.id)
         remaining = max(0, PAY_DAILY_LIMIT - sent_today)
         if amount > remaining:
             return await interaction.followup.send(
@@ -451,9 +484,8 @@ class Economy(commands.Cog):
         if sw.coins < amount:
             return await interaction.followup.send(embed=isla_embed("You don't have enough.\n᲼᲼", title="Pay", icon=self.icon), ephemeral=True)
 
-        await ensure_wallet(self.bot.db, gid, user.id)
-        await add_coins(self.bot.db, gid, sender.id, -amount, kind="pay_out", reason=reason or "", other_user_id=user.id)
-        await add_coins(self.bot.db, gid, user.id, +amount, kind="pay_in", reason=reason or "", other_user_id=sender.id)
+        await transfer_coins(self.bot.db, gid, sender.id, user.id, amount, reason=reason or "")
+        self._sent_today[(gid, sender.id)] = (day, sent_today + amount)
 
         e = isla_embed(
             f"Sent.\n\n{sender.mention} → {user.mention}\n**{fmt(amount)} Coins**\n᲼᲼",
@@ -486,25 +518,29 @@ class Economy(commands.Cog):
             cutoff = 0
             title = "Coins Top (all-time volume)"
 
-        rows = await self.bot.db.fetchall(
-            "SELECT user_id, COALESCE(SUM(ABS(delta)), 0) AS vol FROM economy_ledger WHERE guild_id=? AND ts >= ? GROUP BY user_id ORDER BY vol DESC LIMIT 10",
-            (gid, cutoff)
-        )
+        if cutoff:
+            rows = await self.bot.db.fetchall(
+                "SELECT user_id, SUM(vol) AS vol FROM economy_vol_hourly WHERE guild_id=? AND hour >= ? GROUP BY user_id ORDER BY vol DESC LIMIT 10",
+                (gid, cutoff // 3600)
+            )
+        else:
+            rows = await self.bot.db.fetchall(
+                "SELECT user_id, vol FROM economy_vol_total WHERE guild_id=? ORDER BY vol DESC LIMIT 10",
+                (gid,)
+            )
 
-        lines = []
-        guild = interaction.guild
-        for i, r in enumerate(rows, start=1):
-            uid = int(r["user_id"])
-            vol = int(r["vol"] or 0)
-            m = guild.get_member(uid)
-            name = m.display_name if m else f"User {uid}"
-            lines.append(f"{i}) {name} — {fmt(vol)}")
+        get_member = interaction.guild.get_member
 
-        if not lines:
-            lines = ["No data yet."]
+        def name_of(uid: int) -> str:
+            m = get_member(uid)
+            return m.display_name if m else f"User {uid}"
+
+        board = "\n".join(
+            f"{i}) {name_of(int(r[0]))} — {fmt(int(r[1] or 0))}" for i, r in enumerate(rows, start=1)
+        ) or "No data yet."
 
         e = isla_embed("Leaderboard.\n᲼᲼", title=title, icon=self.icon)
-        e.add_field(name="Top 10", value="\n".join(lines), inline=False)
+        e.add_field(name="Top 10", value=board, inline=False)
         await interaction.followup.send(embed=e, ephemeral=True)
 
     @app_commands.command(name="shop_info", description="Displays purchasable perks (attention, mercy, buffs, cosmetics).")
@@ -594,24 +630,15 @@ class Economy(commands.Cog):
         uid = target.id
         limit = max(1, min(50, int(limit)))
 
-        rows = await get_recent_ledger(self.bot.db, gid, uid, limit=limit)
+        rows, cursor = await get_recent_ledger(self.bot.db, gid, uid, limit=limit)
         if not rows:
             return await interaction.followup.send(embed=isla_embed("Nothing yet.\n᲼᲼", title="History", icon=self.icon), ephemeral=True)
 
-        lines = []
-        for r in rows:
-            delta = int(r["delta"])
-            kind = str(r["kind"])
-            reason = str(r["reason"] or "")
-            ts = int(r["ts"])
-            sign = "+" if delta >= 0 else ""
-            t = time.strftime("%Y-%m-%d %H:%M", time.gmtime(ts))
-            extra = f" — {reason}" if reason else ""
-            lines.append(f"`{t}` {sign}{delta} ({kind}){extra}")
-
-        e = isla_embed(f"{target.mention}\n᲼᲼", title="History", icon=self.icon)
-        e.add_field(name=f"Last {limit}", value="\n".join(lines[:25]), inline=False)
-        await interaction.followup.send(embed=e, ephemeral=True)
+        e = history_embed(target, rows, f"Last {limit}", self.icon)
+        if cursor is None:
+            return await interaction.followup.send(embed=e, ephemeral=True)
+        view = HistoryView(self.bot, gid, target, limit, cursor, self.icon)
+        await interaction.followup.send(embed=e, view=view, ephemeral=True)
 
     @app_commands.command(name="status", description="Shows inactivity tax rules and next tick.")
     async def tax_status(self, interaction: discord.Interaction):
@@ -796,6 +823,7 @@ class Economy(commands.Cog):
             "UPDATE users SET coins=? WHERE guild_id=? AND user_id=?",
             (amount, gid, user.id)
         )
+        self.bot.dispatch("user_stats_changed", gid, user.id)
         desc = f"{user.mention} now has **{fmt(amount)} Coins**.\n᲼᲼"
         await interaction.response.send_message(embed=isla_embed(desc, title="Admin", icon=self.icon), ephemeral=True)
     
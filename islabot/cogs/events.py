@@ -440,6 +440,8 @@ class EventSystem(commands.Cog):
             await self.bot.db.execute("UPDATE users SET coins=coins+? WHERE guild_id=? AND user_id=?", (int(coins), gid, user_id))
         if obedience:
             await self.bot.db.execute("UPDATE users SET obedience=obedience+? WHERE guild_id=? AND user_id=?", (int(obedience), gid, user_id))
+        if coins or obedience:
+            self.bot.dispatch("user_stats_changed", gid, user_id)
 
     async def _token_scope_for_wrapper(self, gid: int) -> int:
         wrapper = await self._active_wrapper(gid)
@@ -1063,6 +1065,7 @@ class EventSystem(commands.Cog):
                     ephemeral=True
                 )
             await self.bot.db.execute("UPDATE users SET coins=coins-? WHERE guild_id=? AND user_id=?", (reroll_cost_coins, gid, interaction.user.id))
+            self.bot.dispatch("user_stats_changed", gid, interaction.user.id)
             paid = f"{reroll_cost_coins} Coins"
 
         # Mark current as claimed with reroll tag
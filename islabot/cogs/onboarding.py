@@ -19,11 +19,26 @@ MODULES = {
     "humiliation": "opt_humiliation",
 }
 
+# /consent view: one line per module plus the two verification flags
+_VIEW_COLUMNS = (*MODULES.values(), "verified_18", "consent_ok")
+_VIEW_TEMPLATE = "\n".join(f"- {k}: {{}}" for k in (*MODULES, "verified_18", "consent_ok"))
+_TICK = ("❌", "✅")
+_VIEW_SQL = f"SELECT {', '.join(_VIEW_COLUMNS)} FROM consent WHERE guild_id=? AND user_id=?"
+# /consent optin|optout: one fixed statement per module, keyed by module name
+_UPDATE_SQL = {m: f"UPDATE consent SET {col}=? WHERE guild_id=? AND user_id=?" for m, col in MODULES.items()}
+
 VACATION_MIN_DAYS = 3
 VACATION_MAX_DAYS = 21
 VACATION_COOLDOWN_SECONDS = 24 * 3600  # 24 hours static cooldown
 TAX_LOCK_HOURS = 24
 
+# Constant replies, built once and reused
+_SERVER_ONLY_EMBED = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
+_GUILD_ONLY_EMBED = create_embed("Guild only.", color="warning", is_dm=False, is_system=False)
+_NO_EMBED = create_embed("No.", color="info", is_dm=False, is_system=False)
+_NO_MEMBER_EMBED = create_embed("Could not get member.", color="info", is_dm=False, is_system=False)
+_RESET_DONE_EMBED = create_embed("Reset complete.", color="success", is_dm=False, is_system=False)
+
 def isla_embed(desc: str, thumb: str = "", title: str | None = None) -> discord.Embed:
     return helper_isla_embed(desc, title=title, thumb=thumb)
 
@@ -83,6 +98,22 @@ class OnboardingRulesDeclineView(discord.ui.View):
 class Onboarding(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+
+        # /verify role ids, parsed once (config.yml is only read at startup); 0/unset dropped, duplicates collapsed.
+        # A malformed id is skipped and logged so it cannot stop the cog from loading.
+        role_ids = []
+        for name in ("verified_18", "consent"):
+            r = bot.cfg.get("roles", name)
+            if not r:
+                continue
+            try:
+                rid = int(r)
+            except (TypeError, ValueError):
+                print(f"ERROR: roles.{name} is not a role id: {r!r}")
+                continue
+            if rid:
+                role_ids.append(rid)
+        self._verify_role_ids = tuple(dict.fromkeys(role_ids))
         
         # Initialize button views for onboarding
         self.welcome_view = OnboardingWelcomeView(self)
@@ -595,41 +626,34 @@ class Onboarding(commands.Cog):
     async def verify(self, interaction: discord.Interaction):
         """Verify command - grant roles and mark as verified."""
         if not interaction.guild or not isinstance(interaction.user, discord.Member):
-            embed = create_embed("Guild only.", color="warning", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_GUILD_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
+        db = self.bot.db
         g = interaction.guild
         m = interaction.user
         gid, uid = g.id, m.id
-        await self.bot.db.ensure_user(gid, uid)
-
-        r18 = self.bot.cfg.get("roles", "verified_18")
-        rcons = self.bot.cfg.get("roles", "consent")
 
         # Best-effort role grants (server chooses how strict this is)
         added = []
-        if r18:
-            role = g.get_role(int(r18))
-            if role and role not in m.roles:
-                try:
-                    await m.add_roles(role, reason="Isla verify")
-                    added.append(role.name)
-                except discord.Forbidden:
-                    pass
-        if rcons:
-            role = g.get_role(int(rcons))
-            if role and role not in m.roles:
-                try:
-                    await m.add_roles(role, reason="Isla verify")
-                    added.append(role.name)
-                except discord.Forbidden:
-                    pass
+        have = {r.id for r in m.roles}
+        to_add = [role for rid in self._verify_role_ids if rid not in have and (role := g.get_role(rid))]
+        if to_add:
+            try:
+                # One member edit for every missing role
+                await m.add_roles(*to_add, reason="Isla verify")
+                added = [r.name for r in to_add]
+            except discord.Forbidden:
+                pass
 
-        await self.bot.db.execute(
-            "UPDATE consent SET verified_18=1, consent_ok=1 WHERE guild_id=? AND user_id=?",
-            (gid, uid),
-        )
+        # Row creation and the consent flags share one commit. The transaction is opened
+        # after the role grants so other writers are not kept waiting on a REST call.
+        async with db.transaction() as tx:
+            await tx.ensure_user(gid, uid)
+            await tx.execute(
+                "UPDATE consent SET verified_18=1, consent_ok=1 WHERE guild_id=? AND user_id=?",
+                (gid, uid),
+            )
         embed = create_embed(f"Verified. Roles added: {', '.join(added) if added else '—'}", color="success", is_dm=False, is_system=False)
         await interaction.followup.send(embed=embed, ephemeral=True)
     
@@ -637,38 +661,33 @@ class Onboarding(commands.Cog):
     async def consent(self, interaction: discord.Interaction, action: str, module: str | None = None):
         """Consent command - view or modify consent modules."""
         if not interaction.guild:
-            embed = create_embed("Guild only.", color="warning", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_GUILD_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
 
-        gid, uid = interaction.guild.id, interaction.user.id
-        await self.bot.db.ensure_user(gid, uid)
+        db = self.bot.db
+        gid, uid = interaction.guild_id, interaction.user.id
+        await db.ensure_user(gid, uid)
 
         action = action.lower().strip()
         if action == "view":
-            row = await self.bot.db.fetchone("SELECT * FROM consent WHERE guild_id=? AND user_id=?", (gid, uid))
+            row = await db.fetchone(_VIEW_SQL, (gid, uid))
             if not row:
                 embed = create_embed("No consent record.", color="info", is_dm=False, is_system=False)
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
-            lines = []
-            for k, col in MODULES.items():
-                lines.append(f"- {k}: {'✅' if int(row[col]) == 1 else '❌'}")
-            lines.append(f"- verified_18: {'✅' if int(row['verified_18']) == 1 else '❌'}")
-            lines.append(f"- consent_ok: {'✅' if int(row['consent_ok']) == 1 else '❌'}")
-            embed = create_embed("\n".join(lines), color="info", is_dm=False, is_system=False)
+            text = _VIEW_TEMPLATE.format(*(_TICK[int(row[c]) == 1] for c in _VIEW_COLUMNS))
+            embed = create_embed(text, color="info", is_dm=False, is_system=False)
             await interaction.followup.send(embed=embed, ephemeral=True)
             return
 
-        if action not in ("optin", "optout") or not module or module not in MODULES:
+        if action not in ("optin", "optout") or module not in _UPDATE_SQL:
             embed = create_embed("Use: /consent action:view OR /consent action:optin|optout module:orders|public_callouts|dm|humiliation", color="warning", is_dm=False, is_system=False)
             await interaction.followup.send(embed=embed, ephemeral=True)
             return
 
-        col = MODULES[module]
         val = 1 if action == "optin" else 0
-        await self.bot.db.execute(f"UPDATE consent SET {col}=? WHERE guild_id=? AND user_id=?", (val, gid, uid))
+        await db.execute(_UPDATE_SQL[module], (val, gid, uid))
         embed = create_embed(f"{module} set to {'ON' if val else 'OFF'}.", color="success", is_dm=False, is_system=False)
         await interaction.followup.send(embed=embed, ephemeral=True)
     
@@ -676,19 +695,35 @@ class Onboarding(commands.Cog):
     async def resetme(self, interaction: discord.Interaction):
         """Reset command - reset user stats."""
         if not interaction.guild:
-            embed = create_embed("Guild only.", color="warning", is_dm=False, is_system=False)
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=_GUILD_ONLY_EMBED, ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
-        gid, uid = interaction.guild.id, interaction.user.id
-        await self.bot.db.ensure_user(gid, uid)
-
-        await self.bot.db.execute("DELETE FROM orders_active WHERE guild_id=? AND user_id=?", (gid, uid))
-        await self.bot.db.execute("UPDATE users SET coins=0,lce=0,debt=0,stage=0,daily_claim_day=NULL,safeword_until_ts=NULL WHERE guild_id=? AND user_id=?", (gid, uid))
-        await self.bot.db.execute("UPDATE consent SET opt_orders=0,opt_public_callouts=0,opt_dm=0,opt_humiliation=0 WHERE guild_id=? AND user_id=?", (gid, uid))
+        db = self.bot.db
+        gid, uid = interaction.guild_id, interaction.user.id
+
+        # One commit for the whole reset. The users/consent upserts create missing rows
+        # with the same column defaults the reset writes, so ensure_user is not needed.
+        async with db.transaction() as tx:
+            await tx.execute("INSERT OR IGNORE INTO server_state(guild_id) VALUES(?)", (gid,))
+            await tx.execute("DELETE FROM orders_active WHERE guild_id=? AND user_id=?", (gid, uid))
+            await tx.execute(
+                """
+                INSERT INTO users(guild_id,user_id) VALUES(?,?)
+                ON CONFLICT(guild_id,user_id) DO UPDATE SET coins=0,lce=0,debt=0,stage=0,daily_claim_day=NULL,safeword_until_ts=NULL
+                """,
+                (gid, uid),
+            )
+            await tx.execute(
+                """
+                INSERT INTO consent(guild_id,user_id) VALUES(?,?)
+                ON CONFLICT(guild_id,user_id) DO UPDATE SET opt_orders=0,opt_public_callouts=0,opt_dm=0,opt_humiliation=0
+                """,
+                (gid, uid),
+            )
+        db.forget_user_state(gid, uid)
+        self.bot.dispatch("user_stats_changed", gid, uid)
 
-        embed = create_embed("Reset complete.", color="success", is_dm=False, is_system=False)
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=_RESET_DONE_EMBED, ephemeral=True)
 
     # -------- global helper for user flags (can be imported elsewhere) --------
     async def isla_user_flags(self, gid: int, uid: int) -> dict:
@@ -751,8 +786,7 @@ class Onboarding(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         await ensure_user_row(self.bot.db, gid, interaction.user.id)
 
@@ -787,8 +821,7 @@ class Onboarding(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         row = await self.bot.db.fetchone(
             "SELECT token, expires_ts FROM optout_confirm WHERE guild_id=? AND user_id=?",
@@ -820,6 +853,8 @@ class Onboarding(commands.Cog):
             """,
             (gid, interaction.user.id)
         )
+        # Coins were zeroed; cogs caching user stats (casino balance) must re-read them
+        self.bot.dispatch("user_stats_changed", gid, interaction.user.id)
 
         # OPTIONAL: reset any extra tables you have (quests, orders, debt, tax, collars)
         # Example (commented out - uncomment and adapt as needed):
@@ -843,8 +878,7 @@ class Onboarding(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         await ensure_user_row(self.bot.db, gid, interaction.user.id)
         await self.bot.db.execute(
@@ -860,8 +894,7 @@ class Onboarding(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         await ensure_user_row(self.bot.db, gid, interaction.user.id)
 
@@ -957,8 +990,7 @@ class Onboarding(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
         if not gid:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_SERVER_ONLY_EMBED, ephemeral=True)
 
         await ensure_user_row(self.bot.db, gid, interaction.user.id)
 
@@ -1020,19 +1052,16 @@ class TestMessageOnboardingGroup(app_commands.Group):
     @app_commands.describe(member="Member to test with (defaults to you)")
     async def test_onboarding_welcome(self, interaction: discord.Interaction, member: discord.Member | None = None):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
         
         if not interaction.guild:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_SERVER_ONLY_EMBED, ephemeral=True)
         
         await interaction.response.defer(ephemeral=True)
         
         test_member = member if member else (interaction.user if isinstance(interaction.user, discord.Member) else None)
         if not test_member:
-            embed = create_embed("Could not get member.", color="info", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_NO_MEMBER_EMBED, ephemeral=True)
         
         channel = await self.cog.get_onboarding_channel(interaction.guild)
         if not channel:
@@ -1045,19 +1074,16 @@ class TestMessageOnboardingGroup(app_commands.Group):
     @app_commands.describe(member="Member to test with (defaults to you)")
     async def test_onboarding_rules(self, interaction: discord.Interaction, member: discord.Member | None = None):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
         
         if not interaction.guild:
-            embed = create_embed("Server only.", color="warning", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_SERVER_ONLY_EMBED, ephemeral=True)
         
         await interaction.response.defer(ephemeral=True)
         
         test_member = member if member else (interaction.user if isinstance(interaction.user, discord.Member) else None)
         if not test_member:
-            embed = create_embed("Could not get member.", color="info", is_dm=False, is_system=False)
-            return await interaction.followup.send(embed=embed, ephemeral=True)
+            return await interaction.followup.send(embed=_NO_MEMBER_EMBED, ephemeral=True)
         
         channel = await self.cog.get_onboarding_channel(interaction.guild)
         if not channel:
@@ -1087,8 +1113,7 @@ class StaffControls(app_commands.Group):
     @app_commands.describe(member="Target", days="Days (1–30)", bypass_locks="Ignore anti-abuse locks")
     async def vacation_set(self, interaction: discord.Interaction, member: discord.Member, days: int, bypass_locks: bool = True):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
@@ -1123,8 +1148,7 @@ class StaffControls(app_commands.Group):
     @app_commands.describe(member="Target", start_cooldown="Start the 24h cooldown")
     async def vacation_clear(self, interaction: discord.Interaction, member: discord.Member, start_cooldown: bool = True):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
@@ -1154,8 +1178,7 @@ class StaffControls(app_commands.Group):
     @app_commands.describe(member="Target")
     async def vacation_cooldown_clear(self, interaction: discord.Interaction, member: discord.Member):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
@@ -1180,8 +1203,7 @@ class StaffControls(app_commands.Group):
     @app_commands.describe(member="Target", enabled="Enable or disable safeword")
     async def safeword_set(self, interaction: discord.Interaction, member: discord.Member, enabled: bool):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
@@ -1213,8 +1235,7 @@ class StaffControls(app_commands.Group):
     @app_commands.describe(member="Target")
     async def safeword_status_staff(self, interaction: discord.Interaction, member: discord.Member):
         if not staff_check(interaction):
-            embed = create_embed("No.", color="info", is_dm=False, is_system=False)
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+            return await interaction.response.send_message(embed=_NO_EMBED, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True)
         gid = interaction.guild_id
@@ -270,6 +270,7 @@ class Orders(commands.Cog):
     async def _apply_rewards(self, gid: int, uid: int, coins: int, obedience: int):
         await self.bot.db.execute("UPDATE users SET coins=coins+?, obedience=obedience+? WHERE guild_id=? AND user_id=?",
                                   (int(coins), int(obedience), gid, uid))
+        self.bot.dispatch("user_stats_changed", gid, uid)
 
     async def _apply_failure_penalty(self, gid: int, uid: int):
         # gentle, capped (not punishing)
@@ -279,6 +280,7 @@ class Orders(commands.Cog):
             current = int(row["obedience"])
             new_obedience = max(0, current - 3)
             await self.bot.db.execute("UPDATE users SET obedience=? WHERE guild_id=? AND user_id=?", (new_obedience, gid, uid))
+            self.bot.dispatch("user_stats_changed", gid, uid)
         await self.bot.db.execute(
             "INSERT OR IGNORE INTO order_stats(guild_id,user_id,completed_total,failed_total,current_streak,best_streak,last_complete_day_key,last_action_ts)"
             " VALUES(?,?,?,?,?,?,?,?)",
@@ -1358,6 +1360,7 @@ class Orders(commands.Cog):
             "UPDATE users SET coins=coins+?, lce=lce+? WHERE guild_id=? AND user_id=?",
             (reward, reward, gid, uid),
         )
+        self.bot.dispatch("user_stats_changed", gid, uid)
 
         # Send a mod log entry if configured
         log_chan_id = self.bot.cfg.get("channels", "logs")
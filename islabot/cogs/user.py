@@ -545,6 +545,7 @@ class User(commands.Cog):
 
         # Delete all user data, then mark optout
         await self.bot.db.hard_delete_user(gid, uid)
+        self.bot.dispatch("user_stats_changed", gid, uid)
         await self.bot.db.set_optout(gid, uid, True, now_ts())
         await self.bot.db.audit(gid, uid, uid, "optout_completed", "{}", now_ts())
 
@@ -106,6 +106,26 @@ class FlagService:
         # Default if not configured
         return True
 
+    async def snapshot(self, guild_id: int, features, channel_id: int | None = None) -> dict[str, bool]:
+        """is_enabled for several features at once, resolved from a single query."""
+        features = tuple(features)
+        if not features:
+            return {}
+        marks = ",".join("?" * len(features))
+        rows = await self.db.fetchall(
+            f"""SELECT scope, feature, enabled FROM feature_flags
+                WHERE guild_id=? AND feature IN ({marks})
+                  AND ((scope='guild' AND scope_id=?) OR (scope='channel' AND scope_id=?))""",
+            (guild_id, *features, guild_id, channel_id if channel_id is not None else -1),
+        )
+        guild_level: dict[str, bool] = {}
+        channel_level: dict[str, bool] = {}
+        for row in rows:
+            target = channel_level if row["scope"] == "channel" else guild_level
+            target[row["feature"]] = int(row["enabled"]) == 1
+        # Same precedence as is_enabled: channel override, then guild override, then on
+        return {f: channel_level.get(f, guild_level.get(f, True)) for f in features}
+
     async def set_guild(self, guild_id: int, feature: str, enabled: bool):
         """Set feature flag at guild level."""
         await self.db.execute(
@@ -1,63 +1,102 @@
 from __future__ import annotations
+import asyncio
+import time
 import aiosqlite
 from contextlib import asynccontextmanager
 
+# Lifetime of cached safeword state (writes through this class update it immediately)
+_USER_STATE_TTL = 60
+
 class Database:
-    def __init__(self, path: str):
+    def __init__(self, path: str, cached_statements: int = 256):
         self.path = path
+        # Size of sqlite3's per-connection prepared statement cache (keyed by SQL text)
+        self.cached_statements = cached_statements
         self.conn: aiosqlite.Connection | None = None
-        self._in_tx: bool = False
+        # Every write shares one connection: transaction() holds _tx_lock for its whole body and
+        # writes from any other task wait on it, so they never land inside (or commit) its BEGIN
+        self._tx_lock = asyncio.Lock()
+        self._tx_owner: asyncio.Task | None = None
+        # Every opted-out (guild_id, user_id); loaded by load_optouts, kept exact by set_optout/hard_delete_user
+        self._opted_out: set[tuple[int, int]] | None = None
+        # (guild_id, user_id) -> (safeword_until_ts, expiry_ts); kept current by set_user_safeword
+        # and dropped by forget_user_state
+        self._safeword_cache: dict[tuple[int, int], tuple[int, int]] = {}
 
     async def connect(self):
-        self.conn = await aiosqlite.connect(self.path)
+        self.conn = await aiosqlite.connect(self.path, cached_statements=self.cached_statements)
         self.conn.row_factory = aiosqlite.Row
         # Enable WAL and foreign keys for better performance and integrity
         await self.conn.execute("PRAGMA journal_mode=WAL;")
         await self.conn.execute("PRAGMA foreign_keys=ON;")
         await self.conn.execute("PRAGMA synchronous=NORMAL;")
+        # Read-side tuning: 256 MB memory-mapped I/O, ~8 MB page cache, temp b-trees in memory
+        await self.conn.execute("PRAGMA mmap_size=268435456;")
+        await self.conn.execute("PRAGMA cache_size=-8192;")
+        await self.conn.execute("PRAGMA temp_store=MEMORY;")
         await self.conn.commit()
 
     async def close(self):
         if self.conn:
             await self.conn.close()
 
+    def _in_own_tx(self) -> bool:
+        """True when the calling task is the one inside transaction()."""
+        return self._tx_owner is not None and self._tx_owner is asyncio.current_task()
+
     async def execute(self, sql: str, params=(), commit: bool = True):
         """Execute SQL statement. If commit=False, don't commit (for use in transactions)."""
         assert self.conn
-        await self.conn.execute(sql, params)
-        # Only commit if explicitly requested AND not inside a transaction
-        effective_commit = commit and not self._in_tx
-        if effective_commit:
-            await self.conn.commit()
+        if self._in_own_tx():
+            # The enclosing transaction commits
+            await self.conn.execute(sql, params)
+            return
+        async with self._tx_lock:
+            await self.conn.execute(sql, params)
+            if commit:
+                await self.conn.commit()
 
     async def executemany(self, sql: str, params_list, commit: bool = True):
         """Execute SQL statement multiple times with different parameters."""
         assert self.conn
-        await self.conn.executemany(sql, params_list)
-        # Only commit if explicitly requested AND not inside a transaction
-        effective_commit = commit and not self._in_tx
-        if effective_commit:
-            await self.conn.commit()
+        if self._in_own_tx():
+            await self.conn.executemany(sql, params_list)
+            return
+        async with self._tx_lock:
+            await self.conn.executemany(sql, params_list)
+            if commit:
+                await self.conn.commit()
 
     async def commit(self):
         """Explicitly commit the current transaction."""
         assert self.conn
-        await self.conn.commit()
+        if self._in_own_tx():
+            return
+        async with self._tx_lock:
+            await self.conn.commit()
 
     @asynccontextmanager
     async def transaction(self):
-        """Transaction context manager: BEGIN on enter, COMMIT on success, ROLLBACK on exception."""
+        """Transaction context manager: BEGIN on enter, COMMIT on success, ROLLBACK on exception.
+
+        Callers are serialized on _tx_lock. A nested transaction() in the same task joins the outer one.
+        """
         assert self.conn
-        self._in_tx = True
-        try:
-            await self.conn.execute("BEGIN")
+        if self._in_own_tx():
             yield self
-            await self.conn.commit()
-        except Exception:
-            await self.conn.rollback()
-            raise
-        finally:
-            self._in_tx = False
+            return
+        async with self._tx_lock:
+            self._tx_owner = asyncio.current_task()
+            try:
+                await self.conn.execute("BEGIN")
+                yield self
+                await self.conn.commit()
+            except BaseException:
+                # Includes cancellation, so the connection is never left inside an open BEGIN
+                await self.conn.rollback()
+                raise
+            finally:
+                self._tx_owner = None
 
     async def fetchone(self, sql: str, params=()):
         assert self.conn
@@ -66,6 +105,22 @@ class Database:
         await cur.close()
         return row
 
+    async def execute_fetchone(self, sql: str, params=(), commit: bool = True):
+        """Execute a write statement with a RETURNING clause and return its first row."""
+        assert self.conn
+        if self._in_own_tx():
+            cur = await self.conn.execute(sql, params)
+            row = await cur.fetchone()
+            await cur.close()
+            return row
+        async with self._tx_lock:
+            cur = await self.conn.execute(sql, params)
+            row = await cur.fetchone()
+            await cur.close()
+            if commit:
+                await self.conn.commit()
+        return row
+
     async def fetchall(self, sql: str, params=()):
         assert self.conn
         cur = await self.conn.execute(sql, params)
@@ -90,6 +145,10 @@ class Database:
         try:
             async with self.transaction():
                 await self._migrate_tables()
+            # Refresh planner statistics so new indexes get picked up; analysis_limit keeps this
+            # to a bounded sample per index on large databases
+            await self.execute("PRAGMA analysis_limit=1000;")
+            await self.execute("ANALYZE;")
         except Exception as e:
             print(f"Database migration error: {e}")
             print(f"Error type: {type(e).__name__}")
@@ -383,10 +442,6 @@ class Database:
             );
             """)
 
-            await self.execute("""
-            CREATE INDEX IF NOT EXISTS idx_weekly_stats_guild_week ON weekly_stats(guild_id, week_key);
-            """)
-
             await self.execute("""
             CREATE TABLE IF NOT EXISTS inventory (
               guild_id INTEGER NOT NULL,
@@ -903,6 +958,72 @@ class Database:
             ON economy_ledger(guild_id, user_id, ts DESC);
             """)
 
+            # Covering index for the weekly royalty ranking
+            await self.execute("""
+            CREATE INDEX IF NOT EXISTS idx_weekly_stats_guild_week_wager
+            ON weekly_stats(guild_id, week_key, casino_wagered DESC, user_id);
+            """)
+            # Prefix of idx_weekly_stats_guild_week_wager
+            await self.execute("DROP INDEX IF EXISTS idx_weekly_stats_guild_week;")
+
+            # Ledger volume rollups kept current by trigger: hourly buckets (UK midnight always falls
+            # on an hour boundary) for day/week windows and the daily pay cap, plus all-time totals
+            new_vol_rollup = not await self.fetchone(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='economy_vol_hourly'"
+            )
+            await self.execute("""
+            CREATE TABLE IF NOT EXISTS economy_vol_hourly (
+              guild_id INTEGER NOT NULL,
+              user_id INTEGER NOT NULL,
+              hour INTEGER NOT NULL,
+              vol INTEGER NOT NULL DEFAULT 0,
+              sent INTEGER NOT NULL DEFAULT 0,
+              PRIMARY KEY (guild_id, user_id, hour)
+            );
+            """)
+            await self.execute("""
+            CREATE INDEX IF NOT EXISTS idx_economy_vol_hourly_guild_hour
+            ON economy_vol_hourly(guild_id, hour, user_id, vol);
+            """)
+            await self.execute("""
+            CREATE TABLE IF NOT EXISTS economy_vol_total (
+              guild_id INTEGER NOT NULL,
+              user_id INTEGER NOT NULL,
+              vol INTEGER NOT NULL DEFAULT 0,
+              PRIMARY KEY (guild_id, user_id)
+            );
+            """)
+            await self.execute("""
+            CREATE INDEX IF NOT EXISTS idx_economy_vol_total_guild_vol
+            ON economy_vol_total(guild_id, vol DESC);
+            """)
+            if new_vol_rollup:
+                await self.execute("""
+                INSERT INTO economy_vol_hourly(guild_id, user_id, hour, vol, sent)
+                SELECT guild_id, user_id, ts / 3600, SUM(ABS(delta)),
+                       SUM(CASE WHEN kind='pay_out' THEN -delta ELSE 0 END)
+                FROM economy_ledger GROUP BY guild_id, user_id, ts / 3600;
+                """)
+                await self.execute("""
+                INSERT OR REPLACE INTO economy_vol_total(guild_id, user_id, vol)
+                SELECT guild_id, user_id, SUM(ABS(delta)) FROM economy_ledger GROUP BY guild_id, user_id;
+                """)
+            await self.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_economy_ledger_vol
+            AFTER INSERT ON economy_ledger
+            BEGIN
+              INSERT INTO economy_vol_hourly(guild_id, user_id, hour, vol, sent)
+              VALUES (NEW.guild_id, NEW.user_id, NEW.ts / 3600, ABS(NEW.delta),
+                      CASE WHEN NEW.kind='pay_out' THEN -NEW.delta ELSE 0 END)
+              ON CONFLICT(guild_id, user_id, hour) DO UPDATE SET
+                vol = vol + excluded.vol,
+                sent = sent + excluded.sent;
+              INSERT INTO economy_vol_total(guild_id, user_id, vol)
+              VALUES (NEW.guild_id, NEW.user_id, ABS(NEW.delta))
+              ON CONFLICT(guild_id, user_id) DO UPDATE SET vol = vol + excluded.vol;
+            END;
+            """)
+
             # Orders & Obedience System
             await self.execute("""
             CREATE TABLE IF NOT EXISTS orders_catalog (
@@ -1661,10 +1782,22 @@ class Database:
         pass
 
     # Advanced Utility Layer: Opt-out methods
+    async def load_optouts(self):
+        """Load every opted-out user into memory (called once at startup)."""
+        rows = await self.fetchall("SELECT guild_id, user_id FROM optout WHERE opted_out=1")
+        self._opted_out = {(int(r["guild_id"]), int(r["user_id"])) for r in rows}
+
+    def opted_out_cached(self, gid: int, uid: int) -> bool | None:
+        """Opt-out status without awaiting; None until load_optouts has run."""
+        if self._opted_out is None:
+            return None
+        return (gid, uid) in self._opted_out
+
     async def is_opted_out(self, gid: int, uid: int) -> bool:
         """Check if user is opted out."""
-        row = await self.fetchone("SELECT opted_out FROM optout WHERE guild_id=? AND user_id=?", (gid, uid))
-        return bool(row and int(row["opted_out"]) == 1)
+        if self._opted_out is None:
+            await self.load_optouts()
+        return (gid, uid) in self._opted_out
 
     async def set_optout(self, gid: int, uid: int, opted_out: bool, ts: int | None):
         """Set opt-out status."""
@@ -1673,6 +1806,11 @@ class Database:
             "UPDATE optout SET opted_out=?, opted_out_ts=? WHERE guild_id=? AND user_id=?",
             (1 if opted_out else 0, ts, gid, uid),
         )
+        if self._opted_out is not None:
+            if opted_out:
+                self._opted_out.add((gid, uid))
+            else:
+                self._opted_out.discard((gid, uid))
 
     async def hard_delete_user(self, gid: int, uid: int):
         """Hard delete all user data across all tables (privacy-safe)."""
@@ -1699,6 +1837,9 @@ class Database:
             await self.execute("DELETE FROM user_discipline WHERE guild_id=? AND user_id=?", (gid, uid))
         except Exception:
             pass
+        if self._opted_out is not None:
+            self._opted_out.discard((gid, uid))
+        self.forget_user_state(gid, uid)
 
     async def audit(self, gid: int, actor_id: int | None, target_user_id: int | None, action: str, meta: str, ts: int):
         """Log an audit entry."""
@@ -1715,6 +1856,22 @@ class Database:
             "UPDATE users SET safeword_until_ts=? WHERE guild_id=? AND user_id=?",
             (until_ts, gid, uid),
         )
+        self._safeword_cache[(gid, uid)] = (int(until_ts or 0), int(time.time()) + _USER_STATE_TTL)
+
+    async def safeword_until(self, gid: int, uid: int) -> int:
+        """Admin-applied safeword expiry for a user (0 if none)."""
+        ts = int(time.time())
+        cached = self._safeword_cache.get((gid, uid))
+        if cached and cached[1] > ts:
+            return cached[0]
+        row = await self.fetchone("SELECT safeword_until_ts FROM users WHERE guild_id=? AND user_id=?", (gid, uid))
+        until = int(row["safeword_until_ts"] or 0) if row else 0
+        self._safeword_cache[(gid, uid)] = (until, ts + _USER_STATE_TTL)
+        return until
+
+    def forget_user_state(self, gid: int, uid: int):
+        """Drop cached safeword state after writing users.safeword_until_ts directly."""
+        self._safeword_cache.pop((gid, uid), None)
 
     # =========================
     # V3 Helper Methods
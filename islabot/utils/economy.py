@@ -36,6 +36,28 @@ async def add_coins(db, guild_id: int, user_id: int, delta: int, kind: str, reas
         (guild_id, user_id, now_ts(), int(delta), kind, reason or "", other_user_id)
     )
 
+async def transfer_coins(db, guild_id: int, from_user_id: int, to_user_id: int, amount: int,
+                         reason: str = "", kind_out: str = "pay_out", kind_in: str = "pay_in"):
+    """Move coins between two wallets in one transaction (one commit, no half-applied transfer)."""
+    amount = int(amount)
+    ts = now_ts()
+    async with db.transaction():
+        await db.executemany(
+            "INSERT OR IGNORE INTO economy_wallet(guild_id,user_id,coins,tax_debt,last_tax_ts) VALUES(?,?,0,0,0)",
+            [(guild_id, from_user_id), (guild_id, to_user_id)]
+        )
+        await db.executemany(
+            "UPDATE economy_wallet SET coins = coins + ? WHERE guild_id=? AND user_id=?",
+            [(-amount, guild_id, from_user_id), (amount, guild_id, to_user_id)]
+        )
+        await db.executemany(
+            "INSERT INTO economy_ledger(guild_id,user_id,ts,delta,kind,reason,other_user_id) VALUES(?,?,?,?,?,?,?)",
+            [
+                (guild_id, from_user_id, ts, -amount, kind_out, reason or "", to_user_id),
+                (guild_id, to_user_id, ts, amount, kind_in, reason or "", from_user_id),
+            ]
+        )
+
 async def set_tax_debt(db, guild_id: int, user_id: int, debt: int):
     await ensure_wallet(db, guild_id, user_id)
     await db.execute(
@@ -43,15 +65,36 @@ async def set_tax_debt(db, guild_id: int, user_id: int, debt: int):
         (int(debt), guild_id, user_id)
     )
 
-async def get_recent_ledger(db, guild_id: int, user_id: int, limit: int = 20):
-    return await db.fetchall(
-        """
-        SELECT ts, delta, kind, reason, other_user_id
-        FROM economy_ledger
-        WHERE guild_id=? AND user_id=?
-        ORDER BY ts DESC
-        LIMIT ?
-        """,
-        (guild_id, user_id, int(limit))
-    )
+async def get_recent_ledger(db, guild_id: int, user_id: int, limit: int = 20, before: tuple[int, int] | None = None):
+    """Newest-first page of a user's ledger; returns (rows, cursor) where cursor is None on the last page.
 
+    Pass the cursor back as `before` for the next page. It is a (ts, id) keyset in the index's own
+    order (ts DESC, rowid ASC), so each page is a single seek on idx_economy_ledger_user_time.
+    """
+    limit = int(limit)
+    if before is None:
+        rows = await db.fetchall(
+            """
+            SELECT id, ts, delta, kind, reason, other_user_id
+            FROM economy_ledger
+            WHERE guild_id=? AND user_id=?
+            ORDER BY ts DESC, id
+            LIMIT ?
+            """,
+            (guild_id, user_id, limit + 1)
+        )
+    else:
+        rows = await db.fetchall(
+            """
+            SELECT id, ts, delta, kind, reason, other_user_id
+            FROM economy_ledger
+            WHERE guild_id=? AND user_id=? AND ts <= ? AND (ts < ? OR id > ?)
+            ORDER BY ts DESC, id
+            LIMIT ?
+            """,
+            (guild_id, user_id, before[0], before[0], before[1], limit + 1)
+        )
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], (int(last["ts"]), int(last["id"]))
@@ -1,20 +1,58 @@
 from __future__ import annotations
 import time
+from collections import OrderedDict
 
 def now_ts() -> int:
     return int(time.time())
 
+# Called with (guild_id, key) after every cfg_set so modules can drop values they cache
+_SET_HOOKS: list = []
+
+def on_cfg_set(fn):
+    _SET_HOOKS.append(fn)
+    return fn
+
+_UPSERT_SQL = """
+    INSERT INTO guild_config(guild_id,key,value,updated_ts)
+    VALUES(?,?,?,?)
+    ON CONFLICT(guild_id,key) DO UPDATE SET value=excluded.value, updated_ts=excluded.updated_ts
+"""
+
+# Read cache: (guild_id, key) -> (value or None when unset, expiry_ts), least recently used first
+_CACHE_TTL = 30
+_CACHE_MAX = 4096
+_cache: OrderedDict[tuple[int, str], tuple[str | None, int]] = OrderedDict()
+
 async def cfg_get(db, guild_id: int, key: str, default: str = "") -> str:
-    row = await db.fetchone("SELECT value FROM guild_config WHERE guild_id=? AND key=?", (guild_id, key))
-    return str(row["value"]) if row else default
+    ck = (guild_id, key)
+    now = now_ts()
+    hit = _cache.get(ck)
+    if hit and hit[1] > now:
+        _cache.move_to_end(ck)
+        value = hit[0]
+    else:
+        row = await db.fetchone("SELECT value FROM guild_config WHERE guild_id=? AND key=?", (guild_id, key))
+        value = str(row["value"]) if row else None
+        _cache[ck] = (value, now + _CACHE_TTL)
+        _cache.move_to_end(ck)
+        if len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return default if value is None else value
+
+def _changed(guild_id: int, keys):
+    # Runs after the write commits, so a read that raced it cannot leave the old value cached
+    for key in keys:
+        _cache.pop((guild_id, key), None)
+        for hook in _SET_HOOKS:
+            hook(guild_id, key)
 
 async def cfg_set(db, guild_id: int, key: str, value: str):
-    await db.execute(
-        """
-        INSERT INTO guild_config(guild_id,key,value,updated_ts)
-        VALUES(?,?,?,?)
-        ON CONFLICT(guild_id,key) DO UPDATE SET value=excluded.value, updated_ts=excluded.updated_ts
-        """,
-        (guild_id, key, str(value), now_ts())
-    )
+    await db.execute(_UPSERT_SQL, (guild_id, key, str(value), now_ts()))
+    _changed(guild_id, (key,))
 
+async def cfg_set_many(db, guild_id: int, values: dict[str, str]):
+    """cfg_set for several keys in one transaction."""
+    ts = now_ts()
+    async with db.transaction():
+        await db.executemany(_UPSERT_SQL, [(guild_id, key, str(value), ts) for key, value in values.items()])
+    _changed(guild_id, values)
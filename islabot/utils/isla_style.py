@@ -11,6 +11,8 @@ def isla_embed(desc: str, title: str | None = None, thumb: str | None = None) ->
     return e
 
 def fmt(n: int | float) -> str:
+    if type(n) is int:
+        return f"{n:,}"
     try:
         return f"{int(n):,}"
     except Exception:
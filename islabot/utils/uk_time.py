@@ -5,11 +5,14 @@ Handles GMT/BST conversion automatically using Europe/London timezone.
 """
 
 from __future__ import annotations
-from datetime import datetime
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 UK_TZ = ZoneInfo("Europe/London")
 
+# Last UK day resolved by uk_day_ymd: [midnight_ts, next_midnight_ts, "YYYY-MM-DD"]
+_DAY_CACHE: list = [0, 0, ""]
+
 
 def uk_now() -> datetime:
     """Get current datetime in UK timezone (GMT/BST)."""
@@ -26,8 +29,16 @@ def uk_day_ymd(ts: int) -> str:
     Returns:
         Date string in YYYY-MM-DD format
     """
-    dt = datetime.fromtimestamp(ts, tz=UK_TZ)
-    return dt.strftime("%Y-%m-%d")
+    cache = _DAY_CACHE
+    if cache[0] <= ts < cache[1]:
+        return cache[2]
+    d = datetime.fromtimestamp(ts, tz=UK_TZ).date()
+    start = datetime(d.year, d.month, d.day, tzinfo=UK_TZ)
+    nxt = d + timedelta(days=1)
+    end = datetime(nxt.year, nxt.month, nxt.day, tzinfo=UK_TZ)
+    ymd = d.isoformat()
+    _DAY_CACHE[:] = [int(start.timestamp()), int(end.timestamp()), ymd]
+    return ymd
 
 
 def uk_hm(ts: int) -> str: